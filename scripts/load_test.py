@@ -0,0 +1,477 @@
+"""Replay Slack events through the bot in-process and report latency percentiles.
+
+Events are dispatched straight into a Bolt ``AsyncApp`` wired with the real
+handlers. Slack's Web API is served by a local fake and the LLM is replaced
+with a fake whose latency follows a log-normal distribution, so no workspace
+or API key is needed.
+
+    python scripts/load_test.py --rate 5 --duration 30
+    python scripts/load_test.py --events recorded.jsonl --rate 20
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+SKILLS = ["Python", "SQL", "AWS", "Java", "React", "Docker", "Kubernetes", "Go"]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class LatencyDistribution:
+    """Log-normal latency with a given median (ms) and shape"""
+
+    def __init__(self, median_ms: float, sigma: float):
+        self.median_ms = median_ms
+        self.sigma = sigma
+
+    def sample(self) -> float:
+        if self.median_ms <= 0:
+            return 0.0
+        return random.lognormvariate(math.log(self.median_ms), self.sigma) / 1000
+
+
+class FakeLLMResponse:
+    def __init__(self, content: str):
+        self.content = content
+
+
+class FakeChatModel:
+    """Stands in for ChatOpenAI; answers each workflow prompt with valid JSON"""
+
+    latency = LatencyDistribution(800, 0.5)
+    calls = 0
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def invoke(self, messages) -> FakeLLMResponse:
+        # Like the real client, this blocks the calling thread
+        FakeChatModel.calls += 1
+        time.sleep(self.latency.sample())
+        prompt = "\n".join(str(message.content) for message in messages)
+        return FakeLLMResponse(self._respond(prompt))
+
+    @staticmethod
+    def _respond(prompt: str) -> str:
+        skills = [skill for skill in SKILLS if skill.lower() in prompt.lower()]
+        if "is a job posting" in prompt:
+            is_job = "hiring" in prompt.lower() or "requirements" in prompt.lower()
+            return json.dumps(
+                {
+                    "is_job_posting": is_job,
+                    "confidence": 0.95 if is_job else 0.1,
+                    "posting_type": "full-time",
+                }
+            )
+        if "Analyze this job posting in detail" in prompt:
+            return json.dumps(
+                {
+                    "job_title": "Software Engineer",
+                    "company_name": "Acme",
+                    "required_skills": skills[:3],
+                    "preferred_skills": skills[3:],
+                    "experience_level": "Entry-level",
+                    "salary_range": "Not specified",
+                    "location": "Remote",
+                    "key_responsibilities": ["Build things"],
+                    "industry": "Technology",
+                    "application_deadline": "Not specified",
+                }
+            )
+        if "skill development" in prompt:
+            return json.dumps(
+                {
+                    "critical_skills_needed": skills[:3],
+                    "skill_development_paths": [],
+                    "recommended_resources": [],
+                    "estimated_learning_time": {},
+                }
+            )
+        return "*Job Analysis* :memo: " + ", ".join(skills)
+
+
+def _minimal_pdf(text: str) -> bytes:
+    """A one-page PDF containing ``text``"""
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode("latin-1")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return pdf
+
+
+class FakeSlackAPI:
+    """Local HTTP server answering the Web API methods the bot uses"""
+
+    def __init__(self, latency: LatencyDistribution):
+        self.latency = latency
+        self.calls: Dict[str, int] = {}
+        self.base_url = ""
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_route("*", "/api/{method}", self._api)
+        app.router.add_get("/files/{file_id}", self._file)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        await web.SockSite(self._runner, sock).start()
+        port = sock.getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+
+    async def _api(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"]
+        self.calls[method] = self.calls.get(method, 0) + 1
+        await asyncio.sleep(self.latency.sample())
+
+        response = {"ok": True}
+        if method == "auth.test":
+            response.update(user_id="UBOT", bot_id="BBOT", team_id="T1")
+        elif method == "files.info":
+            params = dict(request.query)
+            if request.method == "POST":
+                params.update(await request.post())
+            file_id = params.get("file", "F1")
+            response["file"] = {"url_private": f"{self.base_url}/files/{file_id}"}
+        elif method == "chat.postMessage":
+            response.update(channel="C1", ts=f"{time.time():.6f}")
+        return web.json_response(response)
+
+    async def _file(self, request: web.Request) -> web.Response:
+        skills = " ".join(random.sample(SKILLS, 3))
+        return web.Response(
+            body=_minimal_pdf(f"Resume {skills}"), content_type="application/pdf"
+        )
+
+
+def synthetic_events(count: int, mix: Dict[str, float]) -> List[Dict]:
+    """Generate Slack payloads for messages, /upload-resume and modal submissions"""
+    kinds = random.choices(list(mix), weights=list(mix.values()), k=count)
+    events = []
+    for i, kind in enumerate(kinds):
+        event_id = f"Ev{i:06d}"
+        user = f"U{random.randint(1, 200):04d}"
+        if kind == "message":
+            skills = ", ".join(random.sample(SKILLS, 4))
+            text = random.choice(
+                [
+                    f"We're hiring a Software Engineer. Requirements: {skills}.",
+                    f"Looking for an intern role: position requirements {skills}",
+                    "Anyone up for lunch?",
+                ]
+            )
+            events.append(
+                {
+                    "type": "event_callback",
+                    "team_id": "T1",
+                    "api_app_id": "A1",
+                    "event_id": event_id,
+                    "event_time": int(time.time()),
+                    "event": {
+                        "type": "message",
+                        "channel": "C1",
+                        "user": user,
+                        "text": text,
+                        "ts": f"{1700000000 + i}.000100",
+                    },
+                }
+            )
+        elif kind == "command":
+            events.append(
+                {
+                    "command": "/upload-resume",
+                    "text": "",
+                    "team_id": "T1",
+                    "channel_id": "C1",
+                    "user_id": user,
+                    "trigger_id": event_id,
+                    "response_url": "http://localhost/response",
+                }
+            )
+        else:
+            events.append(
+                {
+                    "type": "view_submission",
+                    "team": {"id": "T1"},
+                    "user": {"id": user},
+                    "api_app_id": "A1",
+                    "trigger_id": event_id,
+                    "view": {
+                        "id": f"V{i}",
+                        "type": "modal",
+                        "callback_id": "resume_upload_modal",
+                        "state": {
+                            "values": {
+                                "resume_block": {"resume_file": {"files": [f"F{i}"]}}
+                            }
+                        },
+                    },
+                }
+            )
+    return events
+
+
+def event_key(body: Dict) -> str:
+    return body.get("event_id") or body.get("trigger_id", "")
+
+
+class EventTracker:
+    """Records dispatch, ack and completion times per event"""
+
+    def __init__(self):
+        self.started: Dict[str, float] = {}
+        self.acked: Dict[str, float] = {}
+        self.finished: Dict[str, float] = {}
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    def start(self, key: str) -> None:
+        self.started[key] = time.perf_counter()
+        self._pending[key] = asyncio.get_running_loop().create_future()
+
+    def ack(self, key: str) -> None:
+        self.acked[key] = time.perf_counter()
+
+    def finish(self, key: str) -> None:
+        self.finished[key] = time.perf_counter()
+        future = self._pending.get(key)
+        if future and not future.done():
+            future.set_result(None)
+
+    async def wait(self, key: str, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(asyncio.shield(self._pending[key]), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def monitor_loop_lag(samples: List[float], stop: asyncio.Event) -> None:
+    """Measure how late the event loop wakes a 10 ms sleeper"""
+    interval = 0.01
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, time.perf_counter() - start - interval))
+
+
+def build_app(slack: FakeSlackAPI, data_dir: Path, tracker: EventTracker):
+    """Wire the real handlers into a Bolt app that talks to the fake Slack API"""
+    from slack_bolt.async_app import AsyncApp
+    from slack_sdk.web.async_client import AsyncWebClient
+
+    import src.workflows.job_workflow as job_workflow
+    from src.parsers.resume_parser import ResumeParser
+    from src.slack.message_handlers import MessageHandler
+    from src.slack.resume_handlers import ResumeHandler
+    from src.storage.checkpoints import CheckpointStore
+    from src.storage.posting_index import PostingIndex
+
+    job_workflow.ChatOpenAI = FakeChatModel
+
+    resume_parser = ResumeParser(data_dir / "resumes")
+    message_handler = MessageHandler(
+        resume_parser,
+        PostingIndex(data_dir / "job_postings.jsonl"),
+        checkpoints=CheckpointStore(data_dir / "checkpoints.sqlite3"),
+    )
+    resume_handler = ResumeHandler(resume_parser)
+
+    client = AsyncWebClient(token="xoxb-load-test", base_url=f"{slack.base_url}/api/")
+    app = AsyncApp(
+        client=client,
+        token_verification_enabled=False,
+        request_verification_enabled=False,
+    )
+
+    # Explicit wrappers keep Bolt's argument injection working while marking
+    # when each listener has really finished
+    async def upload_command(ack, body, client):
+        async def tracked_ack(*args, **kwargs):
+            tracker.ack(event_key(body))
+            await ack(*args, **kwargs)
+
+        try:
+            await resume_handler.handle_upload_command(tracked_ack, body, client)
+        finally:
+            tracker.finish(event_key(body))
+
+    async def submission(ack, body, client, view):
+        async def tracked_ack(*args, **kwargs):
+            tracker.ack(event_key(body))
+            await ack(*args, **kwargs)
+
+        try:
+            await resume_handler.handle_submission(tracked_ack, body, client, view)
+        finally:
+            tracker.finish(event_key(body))
+
+    async def message(body, event, say):
+        try:
+            await message_handler.handle_message(event, say)
+        finally:
+            tracker.finish(event_key(body))
+
+    app.command("/upload-resume")(upload_command)
+    app.view("resume_upload_modal")(submission)
+    app.event("message")(message)
+    return app
+
+
+async def run(args: argparse.Namespace) -> Dict:
+    from slack_bolt.request.async_request import AsyncBoltRequest
+
+    os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-load-test")
+    FakeChatModel.latency = LatencyDistribution(args.llm_latency_ms, args.llm_sigma)
+    slack = FakeSlackAPI(LatencyDistribution(args.slack_latency_ms, args.slack_sigma))
+    await slack.start()
+
+    if args.events:
+        with open(args.events) as f:
+            events = [json.loads(line) for line in f if line.strip()]
+    else:
+        mix = {
+            kind: float(weight)
+            for kind, weight in (part.split("=") for part in args.mix.split(","))
+        }
+        events = synthetic_events(max(1, int(args.rate * args.duration)), mix)
+
+    tracker = EventTracker()
+    lag_samples: List[float] = []
+    stop = asyncio.Event()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        app = build_app(slack, Path(data_dir), tracker)
+        monitor = asyncio.create_task(monitor_loop_lag(lag_samples, stop))
+
+        async def dispatch(body: Dict) -> None:
+            key = event_key(body)
+            tracker.start(key)
+            await app.async_dispatch(AsyncBoltRequest(body=body, mode="socket_mode"))
+            # Event callbacks are acked by Bolt as soon as dispatch returns
+            tracker.acked.setdefault(key, time.perf_counter())
+            await tracker.wait(key, args.timeout)
+
+        started = time.perf_counter()
+        tasks = []
+        for body in events:
+            tasks.append(asyncio.create_task(dispatch(body)))
+            # Poisson arrivals at the configured rate
+            await asyncio.sleep(random.expovariate(args.rate))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+        stop.set()
+        await monitor
+    await slack.stop()
+
+    keys = list(tracker.started)
+    end_to_end = [
+        tracker.finished[k] - tracker.started[k] for k in keys if k in tracker.finished
+    ]
+    acks = [tracker.acked[k] - tracker.started[k] for k in keys if k in tracker.acked]
+    return {
+        "events": len(keys),
+        "completed": len(end_to_end),
+        "elapsed": elapsed,
+        "throughput": len(end_to_end) / elapsed if elapsed else 0.0,
+        "end_to_end": end_to_end,
+        "ack": acks,
+        "loop_lag": lag_samples,
+        "llm_calls": FakeChatModel.calls,
+        "slack_calls": slack.calls,
+    }
+
+
+def format_report(results: Dict) -> str:
+    def row(name: str, values: List[float]) -> str:
+        cells = "  ".join(
+            f"p{p}={percentile(values, p) * 1000:8.1f}ms" for p in (50, 95, 99)
+        )
+        return f"  {name:<12} {cells}  max={max(values, default=0) * 1000:8.1f}ms"
+
+    lines = [
+        "Load test report:",
+        f"  events       {results['events']} dispatched, "
+        f"{results['completed']} completed in {results['elapsed']:.1f}s",
+        f"  throughput   {results['throughput']:.2f} events/s",
+        row("end-to-end", results["end_to_end"]),
+        row("ack", results["ack"]),
+        row("loop lag", results["loop_lag"]),
+        f"  llm calls    {results['llm_calls']}",
+        "  slack calls  "
+        + ", ".join(f"{m}={n}" for m, n in sorted(results["slack_calls"].items())),
+    ]
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", type=float, default=2.0, help="events per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds")
+    parser.add_argument(
+        "--events", help="JSON-lines file of recorded Slack payloads to replay"
+    )
+    parser.add_argument(
+        "--mix",
+        default="message=8,command=1,submission=1",
+        help="weights for synthetic event types",
+    )
+    parser.add_argument("--llm-latency-ms", type=float, default=800.0)
+    parser.add_argument("--llm-sigma", type=float, default=0.5)
+    parser.add_argument("--slack-latency-ms", type=float, default=50.0)
+    parser.add_argument("--slack-sigma", type=float, default=0.3)
+    parser.add_argument(
+        "--timeout", type=float, default=120.0, help="per-event completion timeout"
+    )
+    parser.add_argument("--seed", type=int, help="random seed for reproducible runs")
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    print(format_report(asyncio.run(run(args))))
+
+
+if __name__ == "__main__":
+    main()
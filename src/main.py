@@ -1,13 +1,29 @@
+import asyncio
 import os
+import re
 from pathlib import Path
 
-from dotenv import load_dotenv
-from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
-from slack_bolt.async_app import AsyncApp as App
+from src.utils.startup import StartupState
 
-from src.parsers.resume_parser import ResumeParser
-from src.slack.message_handlers import MessageHandler
-from src.slack.resume_handlers import ResumeHandler
+startup = StartupState()
+
+# Heavy dependencies (spaCy, PyPDF2, LangChain, LangGraph) are imported lazily
+# on first use or by the warm-up below, not here
+with startup.phase("import slack_bolt"):
+    from dotenv import load_dotenv
+    from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
+    from slack_bolt.async_app import AsyncApp as App
+
+with startup.phase("import handlers"):
+    from src.parsers.resume_parser import ResumeParser
+    from src.slack.admin_handlers import AdminHandler
+    from src.slack.digest import DigestScheduler
+    from src.slack.message_handlers import MessageHandler
+    from src.slack.resume_handlers import ResumeHandler
+    from src.storage.checkpoints import CheckpointStore
+    from src.storage.digest_queue import DigestQueue
+    from src.storage.posting_index import PostingIndex
+    from src.utils.profiler import SamplingProfiler
 
 # Load environment variables
 load_dotenv()
@@ -16,19 +32,82 @@ load_dotenv()
 app = App(token=os.environ["SLACK_BOT_TOKEN"])
 
 # Initialize components
-resume_parser = ResumeParser()
-message_handler = MessageHandler(resume_parser)
-resume_handler = ResumeHandler(resume_parser)
+with startup.phase("construct components"):
+    resume_parser = ResumeParser(
+        use_llm=os.environ.get("RESUME_EXTRACTOR", "llm").lower() == "llm"
+    )
+    posting_index = PostingIndex(
+        Path("resumes") / "job_postings.jsonl",
+        threshold=float(os.environ.get("POSTING_SIMILARITY_THRESHOLD", "0.85")),
+    )
+    checkpoints = CheckpointStore(
+        Path("resumes") / "checkpoints.sqlite3",
+        max_age=float(os.environ.get("CHECKPOINT_RETENTION_DAYS", "30")) * 24 * 3600,
+    )
+    profiler = SamplingProfiler()
+    digest = None
+    if os.environ.get("DIGEST_MODE", "").lower() in ("1", "true", "yes"):
+        digest = DigestScheduler(
+            DigestQueue(Path("resumes") / "digest_queue.sqlite3"),
+            interval=float(os.environ.get("DIGEST_INTERVAL_MINUTES", "60")) * 60,
+        )
+    message_handler = MessageHandler(
+        resume_parser, posting_index, startup, checkpoints, profiler, digest
+    )
+    resume_handler = ResumeHandler(resume_parser, startup, profiler)
+    admin_handler = AdminHandler(
+        profiler, set(filter(None, os.environ.get("ADMIN_USER_IDS", "").split(",")))
+    )
 
 # Register handlers
 app.command("/upload-resume")(resume_handler.handle_upload_command)
 app.view("resume_upload_modal")(resume_handler.handle_submission)
+app.command("/find-members")(resume_handler.handle_find_command)
 app.event("message")(message_handler.handle_message)
+app.action(re.compile(r"^match_page_"))(message_handler.handle_match_page_action)
+app.command("/profile-bot")(admin_handler.handle_profile_command)
+
+
+def _import_workflow() -> None:
+    import src.workflows.job_workflow  # noqa: F401
+
+
+async def _reindex_resumes() -> None:
+    try:
+        written = await asyncio.to_thread(resume_parser.reindex_resumes)
+        print(f"Re-indexed {written} resume profiles")
+    except Exception as e:
+        print(f"Error re-indexing resume profiles: {str(e)}")
+
+
+async def main() -> None:
+    handler = AsyncSocketModeHandler(app, os.environ["SLACK_APP_TOKEN"])
+    with startup.phase("socket mode connect"):
+        await handler.connect_async()
+
+    background = []
+    if digest:
+        background.append(asyncio.create_task(digest.run(app.client)))
+
+    # Warm up in the background; events received meanwhile wait for readiness
+    await startup.warm_up(
+        [
+            ("spaCy model", resume_parser.warm_up),
+            ("job workflow", _import_workflow),
+            ("posting index", posting_index.refresh),
+        ]
+    )
+    # Re-extracting the roster can take minutes of LLM calls, so it runs
+    # after readiness; events don't wait for it
+    background.append(asyncio.create_task(_reindex_resumes()))
+    # Awaiting the background tasks keeps them referenced and surfaces a
+    # digest crash instead of losing it; the bot itself runs forever
+    await asyncio.gather(*background, asyncio.Event().wait())
+
 
 if __name__ == "__main__":
     # Create resumes directory if it doesn't exist
     Path("resumes").mkdir(exist_ok=True)
 
     # Start the app
-    handler = AsyncSocketModeHandler(app, os.environ["SLACK_APP_TOKEN"])
-    handler.start()
+    asyncio.run(main())
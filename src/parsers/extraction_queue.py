@@ -0,0 +1,70 @@
+import asyncio
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class ExtractionQueue:
+    """Bounded async queue that batches resume texts for extraction.
+
+    Uploads arriving within ``batch_window`` seconds of each other are
+    extracted together, up to ``max_batch`` texts, so a burst of onboarding
+    uploads becomes a few batched extractor calls. When ``max_pending`` texts
+    are waiting, submitters wait for room instead of piling up work.
+    """
+
+    def __init__(
+        self,
+        extract: Callable[[List[str]], List[Dict]],
+        max_pending: int = 100,
+        max_batch: int = 20,
+        batch_window: float = 2.0,
+        workers: int = 2,
+    ):
+        self.extract = extract
+        self.max_batch = max_batch
+        self.batch_window = batch_window
+        self.workers = workers
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._tasks: List[asyncio.Task] = []
+
+    async def submit(self, text: str) -> Dict:
+        """Extract a profile from resume text, batched with concurrent submissions"""
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._worker()) for _ in range(self.workers)
+            ]
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def _worker(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            batch_end = asyncio.get_running_loop().time() + self.batch_window
+            while len(batch) < self.max_batch:
+                item = await self._next(batch_end)
+                if item is None:
+                    break
+                batch.append(item)
+
+            try:
+                profiles = await asyncio.to_thread(
+                    self.extract, [text for text, _ in batch]
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (_, future), profile in zip(batch, profiles):
+                    if not future.done():
+                        future.set_result(profile)
+
+    async def _next(self, batch_end: float) -> Optional[Tuple[str, asyncio.Future]]:
+        timeout = batch_end - asyncio.get_running_loop().time()
+        if timeout <= 0:
+            return None
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
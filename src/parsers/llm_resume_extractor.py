@@ -0,0 +1,179 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from langchain.output_parsers import PydanticOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+from pydantic import BaseModel, Field
+
+from src.parsers.resume_extractor import (
+    EXPERIENCE_LEVELS,
+    NOT_SPECIFIED,
+    ResumeExtractor,
+)
+from src.parsers.skill_taxonomy import canonical_skill
+from src.storage.extraction_cache import ExtractionCache, text_hash
+
+# Rough size of a token in English text; close enough to budget requests
+# without pulling in a tokenizer
+_CHARS_PER_TOKEN = 4
+
+
+class ExtractedResume(BaseModel):
+    """Output schema for one resume in a batch"""
+
+    resume_id: int = Field(description="The number of the resume in the input")
+    technical_skills: List[str] = Field(description="Technical skills and tools")
+    soft_skills: List[str] = Field(description="Soft skills")
+    experience_level: str = Field(
+        description=f"One of: {', '.join(EXPERIENCE_LEVELS)}, {NOT_SPECIFIED}"
+    )
+    education: str = Field(description="Degrees and schools, or empty if none")
+
+
+class ResumeBatch(BaseModel):
+    """Output schema for batched resume extraction"""
+
+    resumes: List[ExtractedResume] = Field(description="One entry per input resume")
+
+
+class LLMResumeExtractor:
+    """Extracts resume profiles with batched structured-output LLM calls.
+
+    Uncached resumes are cleaned, truncated and packed several to a request
+    under a token budget, so onboarding many resumes takes a handful of calls
+    instead of one per resume. Profiles are cached by text hash. Batches the
+    LLM can't handle, because the call fails for any reason or a resume is
+    missing from the answer, go to the local taxonomy extractor instead.
+    """
+
+    name = "llm-v1"
+
+    def __init__(
+        self,
+        fallback: ResumeExtractor,
+        cache: Optional[ExtractionCache] = None,
+        token_budget: int = 6000,
+        max_resume_tokens: int = 2500,
+        max_batch_size: int = 10,
+    ):
+        self.fallback = fallback
+        self.cache = cache
+        self.token_budget = token_budget
+        self.max_resume_tokens = max_resume_tokens
+        self.max_batch_size = max_batch_size
+        self.requests = 0
+        self.fallbacks = 0
+
+        self._parser = PydanticOutputParser(pydantic_object=ResumeBatch)
+
+    def extract(self, text: str) -> Dict:
+        return self.extract_many([text])[0]
+
+    def extract_many(self, texts: List[str]) -> List[Dict]:
+        """Profiles for each text, in order, calling the LLM only for uncached texts"""
+        hashes = [text_hash(text) for text in texts]
+        profiles = self.cache.get_many(hashes, self.name) if self.cache else {}
+
+        missing = {key: text for key, text in zip(hashes, texts) if key not in profiles}
+        for batch in self._pack(missing):
+            try:
+                extracted = self._extract_batch(batch)
+            except Exception as e:
+                # Not just outages: bad requests, auth errors and a missing
+                # API key must not fail uploads or the startup re-index either
+                print(f"LLM extraction failed, extracting resumes locally: {str(e)}")
+                extracted = {}
+
+            if self.cache and extracted:
+                self.cache.put_many(extracted, self.name)
+            profiles.update(extracted)
+
+            leftover = [key for key, _ in batch if key not in extracted]
+            if leftover:
+                self.fallbacks += len(leftover)
+                local = self.fallback.extract_many([missing[key] for key in leftover])
+                profiles.update(zip(leftover, local))
+
+        # Profiles from the local fallback keep its name, so members
+        # extracted while the LLM was failing are retried on the next re-index
+        return [
+            {"extractor": self.name, **profiles[key], "text_hash": key}
+            for key in hashes
+        ]
+
+    def _clean(self, text: str) -> str:
+        text = " ".join(text.split())
+        return text[: self.max_resume_tokens * _CHARS_PER_TOKEN]
+
+    def _pack(self, texts: Dict[str, str]) -> Iterator[List[Tuple[str, str]]]:
+        """Group cleaned texts into batches that fit the token budget"""
+        batch: List[Tuple[str, str]] = []
+        used = 0
+        for key, text in texts.items():
+            cleaned = self._clean(text)
+            tokens = len(cleaned) // _CHARS_PER_TOKEN + 1
+            if batch and (
+                used + tokens > self.token_budget or len(batch) >= self.max_batch_size
+            ):
+                yield batch
+                batch, used = [], 0
+            batch.append((key, cleaned))
+            used += tokens
+        if batch:
+            yield batch
+
+    def _extract_batch(self, batch: List[Tuple[str, str]]) -> Dict[str, Dict]:
+        # Imported here so the workflow module (and LangGraph) loads only
+        # when LLM extraction actually runs
+        from src.workflows.job_workflow import get_llm
+
+        prompt = ChatPromptTemplate.from_messages(
+            [
+                (
+                    "system",
+                    "Extract a profile from each resume below. Use canonical skill "
+                    "names, leave out employers and locations, and return exactly "
+                    "one entry per resume with its resume_id.",
+                ),
+                ("user", "{resumes}"),
+                (
+                    "system",
+                    "Provide the profiles according to this schema: "
+                    "{format_instructions}",
+                ),
+            ]
+        )
+        messages = prompt.format_messages(
+            resumes="\n\n".join(
+                f"### Resume {i}\n{text}" for i, (_, text) in enumerate(batch)
+            ),
+            format_instructions=self._parser.get_format_instructions(),
+        )
+
+        self.requests += 1
+        response = get_llm().invoke(messages, node="resume_extraction")
+        try:
+            result = self._parser.parse(response.content)
+        except Exception as e:
+            print(f"Unparseable resume extraction, extracting locally: {str(e)}")
+            return {}
+
+        extracted = {}
+        for resume in result.resumes:
+            if 0 <= resume.resume_id < len(batch):
+                key = batch[resume.resume_id][0]
+                extracted[key] = _normalize(resume)
+        return extracted
+
+
+def _normalize(resume: ExtractedResume) -> Dict:
+    level = resume.experience_level
+    return {
+        "technical_skills": _skills(resume.technical_skills),
+        "soft_skills": _skills(resume.soft_skills),
+        "experience_level": level if level in EXPERIENCE_LEVELS else NOT_SPECIFIED,
+        "education": resume.education.strip(),
+    }
+
+
+def _skills(names: List[str]) -> List[str]:
+    return list(dict.fromkeys(canonical_skill(name.strip()) for name in names if name))
@@ -0,0 +1,132 @@
+import re
+from typing import Callable, Dict, List, Optional
+
+from src.parsers.skill_taxonomy import CATEGORIES, canonical_skill, find_skills
+from src.storage.extraction_cache import ExtractionCache, text_hash
+
+EXPERIENCE_LEVELS = ["Entry-level", "Mid-level", "Senior"]
+NOT_SPECIFIED = "Not specified"
+
+# Years only count when stated as experience, not e.g. a 4-year degree
+_YEARS = re.compile(
+    r"(\d{1,2})\+?\s*(?:years?|yrs?)['’]?\s+(?:of\s+)?"
+    r"(?:professional\s+|work\s+|industry\s+|relevant\s+)?experience",
+    re.IGNORECASE,
+)
+# Senior job titles, e.g. "Senior Software Engineer". Student roles such as
+# "Team Lead", "Director of Recruitment" or "Staff Writer", and "Senior" as a
+# class year, don't count.
+_SENIOR_TITLES = re.compile(
+    r"\b(?:Senior|Sr\.?|Principal)\s+(?:[A-Z][\w/&-]*\s+){0,2}"
+    r"(?:Engineer|Developer|Analyst|Consultant|Scientist|Architect|Designer|"
+    r"Associate|Manager)\b"
+)
+_ENTRY_TITLES = re.compile(r"\b(?:Intern|Internship|Student|Graduate)\b", re.IGNORECASE)
+_DEGREE = re.compile(
+    r"(?:\b(?:Ph\.?D|MBA|BSc|MSc|Bachelor(?:'s)?|Master(?:'s)?|Doctorate)\b"
+    r"|\b[BM]\.[AS]\.)[^\n]{0,80}"
+)
+_SCHOOL_WORDS = ("University", "College", "Institute", "School")
+
+
+class ResumeExtractor:
+    """Turns resume text into structured ``ResumeData``-shaped profiles.
+
+    Skills come from the curated taxonomy rather than raw named entities, so
+    company names and cities no longer end up as skills. Texts are processed
+    in batches through ``nlp.pipe`` and profiles are cached by text hash.
+    """
+
+    name = "taxonomy-v2"
+
+    def __init__(self, nlp_loader: Callable, cache: Optional[ExtractionCache] = None):
+        self._nlp_loader = nlp_loader
+        self.cache = cache
+
+    def extract(self, text: str) -> Dict:
+        return self.extract_many([text])[0]
+
+    def extract_many(self, texts: List[str]) -> List[Dict]:
+        """Profiles for each text, in order, parsing only uncached texts"""
+        hashes = [text_hash(text) for text in texts]
+        profiles = self.cache.get_many(hashes, self.name) if self.cache else {}
+
+        missing = {key: text for key, text in zip(hashes, texts) if key not in profiles}
+        if missing:
+            nlp = self._nlp_loader()
+            parsed = {
+                key: self._profile(text, doc)
+                for (key, text), doc in zip(
+                    missing.items(), nlp.pipe(missing.values(), batch_size=16)
+                )
+            }
+            if self.cache:
+                self.cache.put_many(parsed, self.name)
+            profiles.update(parsed)
+
+        return [
+            {**profiles[key], "text_hash": key, "extractor": self.name}
+            for key in hashes
+        ]
+
+    def _profile(self, text: str, doc) -> Dict:
+        technical, soft = find_skills(text)
+        education = _education(text, doc)
+        return {
+            "technical_skills": technical,
+            "soft_skills": soft,
+            "experience_level": _experience_level(text, education),
+            "education": education,
+        }
+
+
+def _experience_level(text: str, education: str) -> str:
+    years = max((int(match) for match in _YEARS.findall(text)), default=0)
+    if years >= 5 or _SENIOR_TITLES.search(text):
+        return "Senior"
+    if years >= 2:
+        return "Mid-level"
+    if _ENTRY_TITLES.search(text) or education:
+        return "Entry-level"
+    return NOT_SPECIFIED
+
+
+def _education(text: str, doc) -> str:
+    entries = [match.group(0).strip() for match in _DEGREE.finditer(text)]
+    entries += [
+        ent.text
+        for ent in doc.ents
+        if ent.label_ == "ORG" and any(word in ent.text for word in _SCHOOL_WORDS)
+    ]
+    return "; ".join(dict.fromkeys(entries))
+
+
+_LEVEL_NAMES = {
+    "senior": "Senior",
+    "mid": "Mid-level",
+    "mid-level": "Mid-level",
+    "junior": "Entry-level",
+    "entry": "Entry-level",
+    "entry-level": "Entry-level",
+}
+
+
+def parse_facet_query(query: str) -> Dict:
+    """Split a query like "Senior + Python + AWS" into facets.
+
+    Terms are separated by "+" or commas. Experience levels and skill
+    categories are recognised by name; everything else is a skill.
+    """
+    facets: Dict = {"skills": [], "experience_level": None, "categories": []}
+    for term in re.split(r"[+,]", query):
+        term = term.strip()
+        lowered = term.lower()
+        if not term:
+            continue
+        if lowered in _LEVEL_NAMES:
+            facets["experience_level"] = _LEVEL_NAMES[lowered]
+        elif lowered in CATEGORIES:
+            facets["categories"].append(lowered)
+        else:
+            facets["skills"].append(canonical_skill(term))
+    return facets
@@ -1,12 +1,261 @@
-import json
+import asyncio
 import os
+import threading
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence
 
-import aiohttp  # For async HTTP requests
-import PyPDF2
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
-
-from src.models.schemas import ResumeData
+from src.parsers.extraction_queue import ExtractionQueue
+from src.parsers.resume_extractor import NOT_SPECIFIED, ResumeExtractor
+from src.parsers.skill_taxonomy import canonical_skill, skill_category
+from src.storage.extraction_cache import ExtractionCache
+from src.storage.facet_index import MemberFacetIndex
+from src.storage.match_cache import MatchCache
+from src.storage.skills_store import SkillsStore, StoreChange
 from src.utils.file_helpers import read_pdf_content, save_file
+
+
+class ResumeParser:
+    def __init__(self, resumes_dir: Path = Path("resumes"), use_llm: bool = False):
+        self._nlp = None
+        self._nlp_lock = threading.Lock()
+        self._extractor = None
+        self._extractor_lock = threading.Lock()
+        self.use_llm = use_llm
+        self.resumes_dir = Path(resumes_dir)
+        self.skills_file = self.resumes_dir / "skills_database.json"
+
+        # Shared store; other workers' uploads reach the in-memory index
+        # through change notifications
+        self.store = SkillsStore(self.skills_file)
+        self._members: Dict[str, Dict] = self.store.load()
+        self.facets = MemberFacetIndex()
+        self.facets.rebuild(self._members)
+        self.store.subscribe(self._apply_change)
+
+        self.match_cache = MatchCache()
+        self.extraction_cache = ExtractionCache(
+            self.resumes_dir / "extractions.sqlite3"
+        )
+        # Concurrent uploads are extracted together in batches
+        self.extraction_queue = ExtractionQueue(self._extract_texts)
+
+    @property
+    def nlp(self):
+        """spaCy pipeline, loaded on first use"""
+        with self._nlp_lock:
+            if self._nlp is None:
+                import spacy
+
+                self._nlp = spacy.load("en_core_web_sm")
+        return self._nlp
+
+    @property
+    def extractor(self):
+        """Resume profile extractor, built on first use.
+
+        With ``use_llm``, profiles come from batched LLM calls, falling back
+        to the local taxonomy extractor when the LLM is unavailable.
+        """
+        with self._extractor_lock:
+            if self._extractor is None:
+                local = ResumeExtractor(lambda: self.nlp, self.extraction_cache)
+                if self.use_llm:
+                    # Imported here: pulls in LangChain
+                    from src.parsers.llm_resume_extractor import LLMResumeExtractor
+
+                    self._extractor = LLMResumeExtractor(local, self.extraction_cache)
+                else:
+                    self._extractor = local
+        return self._extractor
+
+    def warm_up(self) -> None:
+        """Load the spaCy model and extractor ahead of the first resume"""
+        self.nlp
+        self.extractor
+
+    def _extract_texts(self, texts: List[str]) -> List[Dict]:
+        return self.extractor.extract_many(texts)
+
+    def _apply_change(self, change: StoreChange) -> None:
+        """Keep the in-memory member index in sync with the store"""
+        if change.user_id is None:
+            self._members = self.store.read_all()
+            self.facets.rebuild(self._members)
+            self.match_cache.clear()
+            return
+
+        previous = self._members.get(change.user_id) or {}
+        # Copy-on-write: listeners run on writer threads while the event
+        # loop may be iterating the current index
+        self._members = {**self._members, change.user_id: change.record}
+        self.facets.update(change.user_id, change.record)
+        self.match_cache.invalidate(
+            set(previous.get("skills", [])) | set(change.record["skills"])
+        )
+
+    async def save_resume(self, user_id: str, file_url: str) -> None:
+        """
+        Download and save a resume, then extract and store the member's profile
+        """
+        headers = {"Authorization": f'Bearer {os.environ["SLACK_BOT_TOKEN"]}'}
+        pdf_path = await save_file(
+            file_url, self.resumes_dir / user_id / "resume.pdf", headers=headers
+        )
+
+        # Parsing and the locked store write block, so keep them off the event loop
+        text = await asyncio.to_thread(read_pdf_content, pdf_path)
+        profile = await self.extraction_queue.submit(text)
+        await asyncio.to_thread(self._update_skills_database, user_id, profile)
+
+    def _update_skills_database(self, user_id: str, profile: Dict) -> None:
+        """
+        Validate a profile against ResumeData and store it for the user
+        """
+        from src.models.schemas import ResumeData
+
+        resume = ResumeData(
+            user_id=user_id,
+            technical_skills=profile["technical_skills"],
+            soft_skills=profile["soft_skills"],
+            experience_level=profile["experience_level"],
+            education=profile["education"],
+        )
+        record = resume.model_dump(exclude={"user_id"})
+        # Flat skill list kept for matching and for older readers of the store
+        record["skills"] = resume.technical_skills + resume.soft_skills
+        record["text_hash"] = profile["text_hash"]
+        record["extractor"] = profile["extractor"]
+        self.store.upsert(user_id, record)
+
+    def reindex_resumes(self, only_stale: bool = True) -> int:
+        """
+        Re-extract profiles from saved resume PDFs in one batch.
+
+        With ``only_stale``, only members whose profile came from another
+        extractor (or an older version of this one) are re-extracted, so an
+        extractor fix reaches profiles stored before it. Only one worker
+        re-indexes at a time; the others skip it and pick up its writes
+        through the store. Returns the number of profiles written.
+        """
+        with self.store.exclusive_task("reindex") as acquired:
+            if not acquired:
+                print("Another worker is re-indexing resumes, skipping")
+                return 0
+            return self._reindex(only_stale)
+
+    def _reindex(self, only_stale: bool) -> int:
+        self.store.refresh()
+        current = self.extractor.name
+        texts = {}
+        for pdf_path in sorted(self.resumes_dir.glob("*/resume.pdf")):
+            user_id = pdf_path.parent.name
+            stored = self._members.get(user_id, {})
+            if only_stale and stored.get("extractor") == current:
+                continue
+            try:
+                texts[user_id] = read_pdf_content(pdf_path)
+            except Exception as e:
+                print(f"Skipping unreadable resume {pdf_path}: {str(e)}")
+
+        profiles = self.extractor.extract_many(list(texts.values()))
+        written = 0
+        for user_id, profile in zip(texts, profiles):
+            stored = self._members.get(user_id, {})
+            if (stored.get("extractor"), stored.get("text_hash")) == (
+                profile["extractor"],
+                profile["text_hash"],
+            ):
+                # Still the fallback's profile (the LLM is failing); rewriting
+                # it unchanged would only churn the journal
+                continue
+            self._update_skills_database(user_id, profile)
+            written += 1
+        return written
+
+    def find_matching_members(self, required_skills: List[str]) -> Dict[str, List[str]]:
+        """
+        Find members who have the required skills and identify skill gaps
+        """
+        self.store.refresh()
+
+        # Stored skills use the taxonomy's canonical names; postings may say
+        # "python", "Amazon Web Services" or "k8s"
+        key = self.match_cache.key(canonical_skill(skill) for skill in required_skills)
+        cached = self.match_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Read the generation before the index: a concurrent change then
+        # invalidates the cache after we start, and put() drops the result
+        generation = self.match_cache.generation
+        members = self._members
+
+        # The facet index narrows the roster to members with any required
+        # skill; only those records are inspected
+        matches = {}
+        for user_id in self.facets.any_skill(key):
+            user_data = members.get(user_id)
+            if user_data is None:
+                continue
+            matching_skills = set(user_data["skills"]).intersection(key)
+            if matching_skills:
+                matches[user_id] = list(matching_skills)
+
+        self.match_cache.put(key, matches, generation)
+        return matches
+
+    def query_members(
+        self,
+        skills: Sequence[str] = (),
+        experience_level: Optional[str] = None,
+        categories: Sequence[str] = (),
+        match_all: bool = True,
+    ) -> Dict[str, List[str]]:
+        """
+        Find members by skills, experience level and skill category, e.g.
+        Senior + Python + AWS. Returns each member's skills that matched
+        """
+        self.store.refresh()
+        members = self._members
+        wanted = {skill.lower() for skill in skills}
+        wanted_categories = {category.lower() for category in categories}
+
+        matches = {}
+        for user_id in self.facets.query(
+            skills, experience_level, categories, match_all
+        ):
+            user_skills = members.get(user_id, {}).get("skills", [])
+            matches[user_id] = [
+                skill
+                for skill in user_skills
+                if skill.lower() in wanted
+                or skill_category(skill) in wanted_categories
+                or not (wanted or wanted_categories)
+            ]
+        return matches
+
+    def resolve_skills(self, names: List[str]) -> List[str]:
+        """
+        Map skill names to the spelling used in the database, ignoring case
+        """
+        self.store.refresh()
+        known = {
+            skill.lower(): skill
+            for user_data in self._members.values()
+            for skill in user_data["skills"]
+        }
+        names = [canonical_skill(name) for name in names]
+        return [known.get(name.lower(), name) for name in names]
+
+    def get_experience_level(self, user_id: str) -> str:
+        """
+        Get a member's experience level from the in-memory index
+        """
+        return self._members.get(user_id, {}).get("experience_level", NOT_SPECIFIED)
+
+    def get_user_skills(self, user_id: str) -> List[str]:
+        """
+        Get skills for a specific user
+        """
+        self.store.refresh()
+        return self._members.get(user_id, {}).get("skills", [])
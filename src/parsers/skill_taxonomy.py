@@ -0,0 +1,150 @@
+import re
+from typing import Dict, List, Pattern, Tuple
+
+# Canonical skill names by category. Aliases map alternative spellings found
+# in resumes onto the canonical name.
+TECHNICAL_SKILLS: Dict[str, List[str]] = {
+    "languages": [
+        "Python",
+        "Java",
+        "JavaScript",
+        "TypeScript",
+        "C++",
+        "C#",
+        "C",
+        "Go",
+        "Rust",
+        "Ruby",
+        "PHP",
+        "Swift",
+        "Kotlin",
+        "R",
+        "MATLAB",
+        "Scala",
+    ],
+    "web": [
+        "HTML",
+        "CSS",
+        "React",
+        "Angular",
+        "Vue",
+        "Node.js",
+        "Express",
+        "Django",
+        "Flask",
+        "Spring",
+        "Next.js",
+    ],
+    "data": [
+        "SQL",
+        "MySQL",
+        "PostgreSQL",
+        "MongoDB",
+        "Excel",
+        "Tableau",
+        "Power BI",
+        "Pandas",
+        "NumPy",
+        "Spark",
+        "Machine Learning",
+        "Data Analysis",
+        "TensorFlow",
+        "PyTorch",
+    ],
+    "cloud": [
+        "AWS",
+        "Azure",
+        "GCP",
+        "Docker",
+        "Kubernetes",
+        "Terraform",
+        "Jenkins",
+        "CI/CD",
+        "Linux",
+        "Git",
+    ],
+    "business": [
+        "Financial Modeling",
+        "Accounting",
+        "Marketing",
+        "Salesforce",
+        "Product Management",
+        "Project Management",
+        "Consulting",
+    ],
+}
+
+SOFT_SKILLS: List[str] = [
+    "Leadership",
+    "Communication",
+    "Teamwork",
+    "Problem Solving",
+    "Public Speaking",
+    "Time Management",
+    "Analytical",
+    "Negotiation",
+    "Mentoring",
+    "Collaboration",
+]
+
+CATEGORIES: List[str] = [*TECHNICAL_SKILLS, "soft"]
+
+ALIASES: Dict[str, str] = {
+    "golang": "Go",
+    "js": "JavaScript",
+    "nodejs": "Node.js",
+    "postgres": "PostgreSQL",
+    "sklearn": "Machine Learning",
+    "k8s": "Kubernetes",
+    "google cloud": "GCP",
+    "amazon web services": "AWS",
+    "team player": "Teamwork",
+    "problem-solving": "Problem Solving",
+}
+
+# Single letters are too ambiguous to find in free text
+_UNMATCHABLE = {"C", "R"}
+
+# Skills that are also everyday words only count when capitalized
+_CASE_SENSITIVE = {"Go", "Spring", "Express", "Swift", "Rust", "Spark", "Excel"}
+
+
+def skill_category(skill: str) -> str:
+    """Category of a canonical skill; "soft" for soft skills, "other" if unknown"""
+    return _CATEGORY_BY_SKILL.get(skill, "other")
+
+
+def canonical_skill(name: str) -> str:
+    """Canonical spelling of a skill name or alias; unknown names are unchanged"""
+    lowered = name.lower()
+    return ALIASES.get(lowered) or _CANONICAL.get(lowered, name)
+
+
+def find_skills(text: str) -> Tuple[List[str], List[str]]:
+    """Find (technical, soft) skills mentioned in text, in canonical spelling"""
+    found = set()
+    for pattern, skill in _PATTERNS:
+        if pattern.search(text):
+            found.add(skill)
+    technical = [s for s in _ORDER if s in found and skill_category(s) != "soft"]
+    soft = [s for s in _ORDER if s in found and skill_category(s) == "soft"]
+    return technical, soft
+
+
+def _pattern(name: str) -> Pattern:
+    # Word boundaries that also work around symbols like C++, C# and Node.js
+    flags = 0 if name in _CASE_SENSITIVE else re.IGNORECASE
+    return re.compile(rf"(?<![\w+#.]){re.escape(name)}(?![\w+#]|\.\w)", flags)
+
+
+_CATEGORY_BY_SKILL: Dict[str, str] = {
+    skill: category for category, skills in TECHNICAL_SKILLS.items() for skill in skills
+}
+_CATEGORY_BY_SKILL.update({skill: "soft" for skill in SOFT_SKILLS})
+
+_ORDER: List[str] = list(_CATEGORY_BY_SKILL)
+_CANONICAL: Dict[str, str] = {skill.lower(): skill for skill in _ORDER}
+
+_PATTERNS: List[Tuple[Pattern, str]] = [
+    (_pattern(skill), skill) for skill in _ORDER if skill not in _UNMATCHABLE
+] + [(_pattern(alias), skill) for alias, skill in ALIASES.items()]
@@ -0,0 +1,91 @@
+import asyncio
+import re
+import time
+from typing import Optional, Set, Tuple
+
+from src.slack.formatters import format_error_message
+from src.utils.profiler import SamplingProfiler
+
+# Upper bound so a forgotten profile can't run indefinitely
+MAX_PROFILE_SECONDS = 600
+
+
+class AdminHandler:
+    def __init__(self, profiler: SamplingProfiler, admin_user_ids: Set[str]):
+        self.profiler = profiler
+        self.admin_user_ids = admin_user_ids
+        # Delivery tasks are only weakly referenced by the event loop; keep
+        # them here until they finish so they can't be collected mid-run
+        self._deliveries: Set[asyncio.Task] = set()
+
+    async def handle_profile_command(self, ack, body, client) -> None:
+        """Handle /profile-bot [<seconds>s | <n> events | stop]"""
+        await ack()
+        user_id = body["user_id"]
+        channel_id = body["channel_id"]
+
+        async def reply(text: str) -> None:
+            await client.chat_postEphemeral(channel=channel_id, user=user_id, text=text)
+
+        if user_id not in self.admin_user_ids:
+            await reply(format_error_message("/profile-bot is restricted to admins"))
+            return
+
+        text = body.get("text", "").strip().lower()
+        if text == "stop":
+            if not self.profiler.active:
+                await reply("No profile is running.")
+                return
+            self.profiler.stop()
+            await reply("Stopping the profiler; results will be sent to you shortly.")
+            return
+
+        duration, max_events = self._parse_limits(text)
+        if duration is None and max_events is None:
+            await reply(
+                format_error_message(
+                    "Usage: /profile-bot [<seconds>s | <n> events | stop]"
+                )
+            )
+            return
+        if not self.profiler.start(duration=duration, max_events=max_events):
+            await reply(format_error_message("A profile is already running"))
+            return
+
+        limit = f"{max_events} events" if max_events else f"{duration:.0f}s"
+        await reply(f"🔍 Profiling the next {limit}. Results will be sent by DM.")
+        task = asyncio.create_task(self._deliver(client, user_id))
+        self._deliveries.add(task)
+        task.add_done_callback(self._deliveries.discard)
+
+    @staticmethod
+    def _parse_limits(text: str) -> Tuple[Optional[float], Optional[int]]:
+        """Return (duration, max_events); defaults to 30 seconds.
+
+        Zero limits are rejected: they would leave the profiler unbounded.
+        """
+        if not text:
+            return 30.0, None
+        events = re.fullmatch(r"(\d+)\s*events?", text)
+        if events and int(events.group(1)) > 0:
+            # Still bounded in time in case traffic is quiet
+            return float(MAX_PROFILE_SECONDS), int(events.group(1))
+        seconds = re.fullmatch(r"(\d+(?:\.\d+)?)\s*s?", text)
+        if seconds and float(seconds.group(1)) > 0:
+            return min(float(seconds.group(1)), MAX_PROFILE_SECONDS), None
+        return None, None
+
+    async def _deliver(self, client, user_id: str) -> None:
+        """Wait for the profile to finish and upload it to the admin"""
+        try:
+            await self.profiler.wait()
+            dm = await client.conversations_open(users=user_id)
+            await client.files_upload_v2(
+                channel=dm["channel"]["id"],
+                content=self.profiler.collapsed() or "(no samples)",
+                filename=f"profile-{int(time.time())}.collapsed.txt",
+                title="Bot profile (collapsed stacks)",
+                initial_comment=self.profiler.summary(),
+            )
+        except Exception as e:
+            print(f"Error delivering profile: {str(e)}")
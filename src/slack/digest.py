@@ -0,0 +1,124 @@
+import asyncio
+import time
+from typing import Dict, List
+
+from src.slack.formatters import format_channel_digest, format_member_digest
+from src.storage.digest_queue import DigestQueue
+
+# Values the analyzers fill in when a posting doesn't state a field
+_PLACEHOLDERS = {"", "n/a", "none", "unknown", "not specified"}
+
+
+def _known(value: str) -> str:
+    value = " ".join(value.lower().split())
+    if value in _PLACEHOLDERS or value.endswith(" not specified"):
+        return ""
+    return value
+
+
+def posting_key(details: Dict, source: str) -> str:
+    """Identify a posting across reposts by its title and company.
+
+    Postings missing either are keyed by ``source`` (the message they came
+    from) instead, so unrelated untitled postings don't replace each other.
+    """
+    title = _known(details.get("job_title", ""))
+    company = _known(details.get("company_name", ""))
+    if title and company:
+        return f"{title}|{company}"
+    return f"message|{source}"
+
+
+class DigestScheduler:
+    """Batches job posting matches into one message per recipient per interval.
+
+    Each channel gets a digest of the postings analyzed in it and each matching
+    member gets a DM of the postings they match, so Slack API calls scale with
+    recipients rather than postings. Sends are spaced to stay within
+    chat.postMessage rate limits.
+    """
+
+    def __init__(
+        self,
+        queue: DigestQueue,
+        interval: float = 3600.0,
+        messages_per_second: float = 1.0,
+    ):
+        self.queue = queue
+        self.interval = interval
+        self.min_send_gap = 1.0 / messages_per_second
+        self._last_send = 0.0
+
+    def add(
+        self,
+        channel: str,
+        ts: str,
+        details: Dict,
+        matches: Dict[str, List[str]],
+    ) -> None:
+        """Queue an analyzed posting for the channel digest and each matching member"""
+        key = posting_key(details, f"{channel}:{ts}")
+        job_title = details.get("job_title", "Position not specified")
+        company_name = details.get("company_name", "Company not specified")
+
+        self.queue.enqueue(
+            channel,
+            key,
+            {
+                "kind": "channel",
+                "job_title": job_title,
+                "company_name": company_name,
+                "required_skills": details.get("required_skills", []),
+                "matches": matches,
+            },
+        )
+        for user_id, skills in matches.items():
+            self.queue.enqueue(
+                user_id,
+                key,
+                {
+                    "kind": "member",
+                    "job_title": job_title,
+                    "company_name": company_name,
+                    "channel": channel,
+                    "matching_skills": skills,
+                },
+            )
+
+    async def run(self, client) -> None:
+        """Flush digests every interval, forever"""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush(client)
+            except Exception as e:
+                print(f"Error flushing digests: {str(e)}")
+
+    async def flush(self, client) -> int:
+        """Send each recipient one message with everything queued for them"""
+        claim_id, pending = await asyncio.to_thread(self.queue.claim_all)
+        sent = 0
+        for recipient, items in pending.items():
+            if items[0]["kind"] == "channel":
+                text = format_channel_digest(items)
+            else:
+                text = format_member_digest(items)
+
+            await self._wait_for_rate_limit()
+            try:
+                await client.chat_postMessage(channel=recipient, text=text)
+            except Exception as e:
+                print(f"Error sending digest to {recipient}: {str(e)}")
+                await asyncio.to_thread(self.queue.release, recipient, claim_id)
+            else:
+                # Only now are the entries gone; a crash before this point
+                # leaves them to be claimed again when the lease expires
+                await asyncio.to_thread(self.queue.ack, recipient, claim_id)
+                sent += 1
+        return sent
+
+    async def _wait_for_rate_limit(self) -> None:
+        delay = self._last_send + self.min_send_gap - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self._last_send = time.monotonic()
@@ -1,14 +1,109 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 
+from src.slack.match_pages import (
+    FILTERS,
+    SORTS,
+    MatchPage,
+    next_cursor,
+    previous_cursor,
+    rank_matches,
+)
 
-def format_job_matches(matching_members: Dict[str, List[str]]) -> str:
-    """Format matching members for Slack output"""
-    matches_text = "*Matching Members:*\n"
-    for user_id, skills in matching_members.items():
+# Plain-text member lists stop here; posted job matches page instead
+MAX_LISTED_MEMBERS = 20
+
+
+def format_job_matches(
+    matching_members: Dict[str, List[str]],
+    heading: str = "Matching Members",
+    limit: Optional[int] = MAX_LISTED_MEMBERS,
+) -> str:
+    """Format matching members for Slack output, most matching skills first.
+
+    At most ``limit`` members are listed; the rest are only counted.
+    """
+    listed = rank_matches(matching_members, limit)
+    matches_text = f"*{heading}:*\n"
+    for user_id, skills in listed:
         matches_text += f"• <@{user_id}> - Matching skills: {', '.join(skills)}\n"
+    if len(listed) < len(matching_members):
+        matches_text += f"…and {len(matching_members) - len(listed)} more\n"
     return matches_text
 
 
+def format_match_page(
+    page: MatchPage, heading: str = "Matching Members", interactive: bool = True
+) -> List[Dict]:
+    """Format one page of ranked matches as Block Kit blocks.
+
+    With ``interactive``, the page ends with buttons whose values carry the
+    cursor for the page they lead to.
+    """
+    cursor = page.cursor
+    summary = f"*{heading}:* {page.total} with {FILTERS[cursor.filter]}"
+    lines = [
+        f"• <@{user_id}> - Matching skills: {', '.join(skills)}"
+        for user_id, skills in page.matches
+    ]
+    blocks = [
+        {"type": "section", "text": {"type": "mrkdwn", "text": summary}},
+        {
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": "\n".join(lines) or "No members."},
+        },
+    ]
+    if page.matches:
+        start = cursor.offset + 1
+        end = cursor.offset + len(page.matches)
+        blocks.append(
+            {
+                "type": "context",
+                "elements": [
+                    {
+                        "type": "mrkdwn",
+                        "text": f"Showing {start}-{end} of {page.total}, "
+                        f"sorted by {SORTS[cursor.sort]}",
+                    }
+                ],
+            }
+        )
+    if not interactive:
+        return blocks
+
+    other_sort = "level" if cursor.sort == "skills" else "skills"
+    other_filter = "all" if cursor.filter == "any" else "any"
+    buttons = [
+        ("match_page_previous", "Previous", previous_cursor(page)),
+        ("match_page_more", "Show more", next_cursor(page)),
+        (
+            "match_page_sort",
+            f"Sort by {SORTS[other_sort]}",
+            cursor.move(sort=other_sort, offset=0),
+        ),
+        (
+            "match_page_filter",
+            f"Match {FILTERS[other_filter]}",
+            cursor.move(filter=other_filter, offset=0),
+        ),
+    ]
+    blocks.append(
+        {
+            "type": "actions",
+            "elements": [
+                {
+                    "type": "button",
+                    "action_id": action_id,
+                    "text": {"type": "plain_text", "text": text},
+                    "value": target.encode(),
+                }
+                for action_id, text, target in buttons
+                if target is not None
+            ],
+        }
+    )
+    return blocks
+
+
 def format_error_message(error: str) -> str:
     """Format error messages for Slack"""
     return f"⚠️ Error: {error}"
@@ -24,3 +119,34 @@ def format_job_analysis(analysis_results: Dict) -> str:
             f"*Experience Level:* {analysis_results['experience_level']}",
         ]
     )
+
+
+def format_skill_list(heading: str, skills: List[str]) -> str:
+    """Format a list of skills for Slack"""
+    if not skills:
+        return f"*{heading}:* none listed"
+    return f"*{heading}:* {', '.join(skills)}"
+
+
+def format_channel_digest(items: List[Dict]) -> str:
+    """Format a channel's batched job posting matches for Slack"""
+    lines = [f"*Job Postings Digest* 📬 ({len(items)} postings)"]
+    for item in items:
+        lines.append(f"\n*{item['job_title']}* at {item['company_name']}")
+        lines.append(f"Required skills: {', '.join(item['required_skills'])}")
+        if item["matches"]:
+            members = ", ".join(f"<@{user_id}>" for user_id in item["matches"])
+            lines.append(f"Matching members: {members}")
+    return "\n".join(lines)
+
+
+def format_member_digest(items: List[Dict]) -> str:
+    """Format the job postings a member matched since the last digest"""
+    lines = [f"*Job postings that match your skills* 🎯 ({len(items)})"]
+    for item in items:
+        lines.append(
+            f"• *{item['job_title']}* at {item['company_name']} "
+            f"in <#{item['channel']}> - "
+            f"Matching skills: {', '.join(item['matching_skills'])}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,106 @@
+import heapq
+import json
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.parsers.skill_taxonomy import canonical_skill, skill_category
+
+PAGE_SIZE = 5
+
+SORTS = {"skills": "most matching skills", "level": "experience level"}
+FILTERS = {"any": "any required skill", "all": "every required skill"}
+
+_LEVEL_RANK = {"Senior": 3, "Mid-level": 2, "Entry-level": 1}
+
+
+def rank_matches(
+    matches: Dict[str, List[str]], limit: Optional[int] = None
+) -> List[Tuple[str, List[str]]]:
+    """The ``limit`` members with the most matching skills, best first"""
+    if limit is None:
+        return sorted(matches.items(), key=_by_skills)
+    return heapq.nsmallest(limit, matches.items(), key=_by_skills)
+
+
+def _by_skills(item: Tuple[str, List[str]]):
+    return (-len(item[1]), item[0])
+
+
+@dataclass(frozen=True)
+class MatchCursor:
+    """Position in the matches of an analyzed posting.
+
+    The posting is identified by the channel and ts its analysis was
+    checkpointed under; the cursor travels in Block Kit button values.
+    """
+
+    channel: str
+    ts: str
+    offset: int = 0
+    sort: str = "skills"
+    filter: str = "any"
+
+    def encode(self) -> str:
+        return json.dumps(
+            [self.channel, self.ts, self.offset, self.sort, self.filter],
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def decode(cls, value: str) -> "MatchCursor":
+        channel, ts, offset, sort, match_filter = json.loads(value)
+        return cls(channel, ts, offset, sort, match_filter)
+
+    def move(self, **changes) -> "MatchCursor":
+        return replace(self, **changes)
+
+
+@dataclass(frozen=True)
+class MatchPage:
+    cursor: MatchCursor
+    matches: List[Tuple[str, List[str]]]
+    total: int
+
+
+def get_page(
+    matches: Dict[str, List[str]],
+    required_skills: List[str],
+    cursor: MatchCursor,
+    level_of: Callable[[str], str],
+    page_size: int = PAGE_SIZE,
+) -> MatchPage:
+    """Rank, filter and slice matches for one page.
+
+    Only the members up to the end of the page are ranked, so the first page
+    stays cheap no matter how many members match.
+    """
+    candidates = matches.items()
+    if cursor.filter == "all":
+        # Stored skills all come from the taxonomy, so required skills outside
+        # it ("strong work ethic", "5+ years of SaaS") could never match
+        canonical = (canonical_skill(skill) for skill in required_skills)
+        required = {skill for skill in canonical if skill_category(skill) != "other"}
+        candidates = [(u, s) for u, s in candidates if required <= set(s)]
+    else:
+        candidates = list(candidates)
+
+    def rank(item: Tuple[str, List[str]]):
+        level = _LEVEL_RANK.get(level_of(item[0]), 0) if cursor.sort == "level" else 0
+        return (-level, *_by_skills(item))
+
+    offset = min(cursor.offset, max(0, len(candidates) - 1))
+    top = heapq.nsmallest(offset + page_size, candidates, key=rank)
+    return MatchPage(cursor.move(offset=offset), top[offset:], len(candidates))
+
+
+def next_cursor(page: MatchPage, page_size: int = PAGE_SIZE) -> Optional[MatchCursor]:
+    end = page.cursor.offset + page_size
+    return page.cursor.move(offset=end) if end < page.total else None
+
+
+def previous_cursor(
+    page: MatchPage, page_size: int = PAGE_SIZE
+) -> Optional[MatchCursor]:
+    if page.cursor.offset <= 0:
+        return None
+    return page.cursor.move(offset=max(0, page.cursor.offset - page_size))
@@ -1,39 +1,203 @@
-from typing import Dict
+import asyncio
+from typing import Callable, Dict, List, Optional
 
 from typing_extensions import Awaitable
 
 from src.parsers.resume_parser import ResumeParser
-from src.slack.formatters import format_error_message, format_job_matches
-from src.workflows.job_workflow import analyze_job_posting
+from src.slack.digest import DigestScheduler
+from src.slack.formatters import format_match_page
+from src.slack.match_pages import MatchCursor, get_page
+from src.storage.checkpoints import CheckpointStore
+from src.storage.posting_index import PostingIndex
+from src.utils.profiler import SamplingProfiler
+from src.utils.resilience import LLMUnavailableError
+from src.utils.startup import StartupState
+from src.workflows.follow_ups import answer_follow_up, is_question
 
 
 class MessageHandler:
-    def __init__(self, resume_parser: ResumeParser):
+    def __init__(
+        self,
+        resume_parser: ResumeParser,
+        posting_index: Optional[PostingIndex] = None,
+        startup: Optional[StartupState] = None,
+        checkpoints: Optional[CheckpointStore] = None,
+        profiler: Optional[SamplingProfiler] = None,
+        digest: Optional[DigestScheduler] = None,
+    ):
         self.resume_parser = resume_parser
+        self.posting_index = posting_index
+        self.startup = startup
+        self.checkpoints = checkpoints
+        # An idle profiler costs nothing, so always have one
+        self.profiler = profiler or SamplingProfiler()
+        # In digest mode matches are batched instead of posted per posting
+        self.digest = digest
 
     async def handle_message(self, event: Dict, say) -> None:
         """Handle incoming Slack messages"""
-        try:
-            text = event.get("text", "")
-            analysis_results = analyze_job_posting(text)
-
-            if analysis_results["success"]:
-                if analysis_results["recommendations"]:
-                    await say(analysis_results["recommendations"][0])
-
-                if "details" in analysis_results["results"]:
-                    required_skills = analysis_results["results"]["details"][
-                        "required_skills"
-                    ]
-                    matching_members = self.resume_parser.find_matching_members(
-                        required_skills
+        with self.profiler.track("message"):
+            try:
+                if self.startup:
+                    await self.startup.wait_ready()
+
+                if await self._handle_follow_up(event, say):
+                    return
+
+                # Imported on first use: pulls in LangChain and LangGraph
+                from src.workflows.job_workflow import analyze_job_posting
+
+                text = event.get("text", "")
+                # The workflow blocks on LLM calls; keep it off the event loop
+                analysis_results = await asyncio.to_thread(
+                    analyze_job_posting, text, self.posting_index
+                )
+                state = analysis_results.get("state")
+
+                if analysis_results["success"]:
+                    if analysis_results["recommendations"] and not self.digest:
+                        await say(analysis_results["recommendations"][0])
+
+                    classification = analysis_results["results"].get(
+                        "classification", {}
+                    )
+                    is_job_posting = classification.get("is_job_posting", False)
+                    details = analysis_results["results"].get("details")
+                    if details:
+                        # Refreshing the member index can wait on the store's
+                        # file lock; keep it off the event loop too
+                        matching_members = await asyncio.to_thread(
+                            self.resume_parser.find_matching_members,
+                            details["required_skills"],
+                        )
+                        state["matching_results"] = matching_members
+
+                    # Saved before the matches are posted: their page buttons
+                    # read the matches back from this checkpoint. Only job
+                    # postings get one, so only their threads get follow-ups.
+                    checkpointed = self.checkpoints is not None and is_job_posting
+                    if checkpointed:
+                        await asyncio.to_thread(
+                            self.checkpoints.save, event["channel"], event["ts"], state
+                        )
+
+                    if details and matching_members:
+                        if not self.digest:
+                            cursor = MatchCursor(event["channel"], event["ts"])
+                            await self._post_match_page(
+                                say, cursor, details, matching_members, checkpointed
+                            )
+                        elif is_job_posting:
+                            # Non-postings and postings nobody matches stay
+                            # out of the digest
+                            await asyncio.to_thread(
+                                self.digest.add,
+                                event["channel"],
+                                event["ts"],
+                                details,
+                                matching_members,
+                            )
+                else:
+                    print(f"Error analyzing job posting: {analysis_results['error']}")
+
+            except Exception as e:
+                print(f"Error in message handler: {str(e)}")
+
+    async def handle_match_page_action(self, ack, body, client) -> None:
+        """Handle the show more, sort and filter buttons under posted matches"""
+        with self.profiler.track("match_page"):
+            await ack()
+            try:
+                cursor = MatchCursor.decode(body["actions"][0]["value"])
+                state = None
+                if self.checkpoints:
+                    state = await asyncio.to_thread(
+                        self.checkpoints.load, cursor.channel, cursor.ts
+                    )
+                if state is None:
+                    await client.chat_postEphemeral(
+                        channel=body["channel"]["id"],
+                        user=body["user"]["id"],
+                        text="These matches have expired; repost the job to refresh.",
                     )
+                    return
 
-                    if matching_members:
-                        response = format_job_matches(matching_members)
-                        await say(response)
-            else:
-                print(f"Error analyzing job posting: {analysis_results['error']}")
+                details = state["analysis_results"].get("details", {})
 
-        except Exception as e:
-            print(f"Error in message handler: {str(e)}")
+                async def update(text: str, blocks: List[Dict]) -> None:
+                    await client.chat_update(
+                        channel=body["channel"]["id"],
+                        ts=body["message"]["ts"],
+                        text=text,
+                        blocks=blocks,
+                    )
+
+                await self._post_match_page(
+                    update, cursor, details, state["matching_results"], True
+                )
+            except Exception as e:
+                print(f"Error in match page action: {str(e)}")
+
+    async def _post_match_page(
+        self,
+        send: Callable[..., Awaitable],
+        cursor: MatchCursor,
+        details: Dict,
+        matching_members: Dict[str, List[str]],
+        interactive: bool,
+    ) -> None:
+        """Rank and render one page of matches, then send it.
+
+        Pages get buttons only when ``interactive``, i.e. when the matches
+        were checkpointed for the buttons to read back.
+        """
+        page = get_page(
+            matching_members,
+            details.get("required_skills", []),
+            cursor,
+            self.resume_parser.get_experience_level,
+        )
+        await send(
+            text=f"Matching Members: {page.total}",
+            blocks=format_match_page(page, interactive=interactive),
+        )
+
+    async def _handle_follow_up(self, event: Dict, say) -> bool:
+        """Answer a thread reply to an analyzed posting from its checkpoint"""
+        thread_ts = event.get("thread_ts")
+        if not self.checkpoints or not thread_ts or thread_ts == event.get("ts"):
+            return False
+        if event.get("bot_id"):
+            # Our own thread answers must not trigger more answers
+            return True
+
+        state = await asyncio.to_thread(
+            self.checkpoints.load, event["channel"], thread_ts
+        )
+        if state is None:
+            return False
+
+        question = event.get("text", "")
+        # Looks up members, which can wait on the store's file lock
+        answer = await asyncio.to_thread(
+            answer_follow_up, state, question, self.resume_parser
+        )
+        if answer is None:
+            if not is_question(question):
+                # Thread chatter ("thanks!", "applied") doesn't need the LLM
+                return True
+
+            answer = await self._answer_with_llm(state, question)
+
+        await say(text=answer, thread_ts=thread_ts)
+        return True
+
+    async def _answer_with_llm(self, state: Dict, question: str) -> str:
+        """Answer a follow-up the rule-based answers don't cover"""
+        from src.workflows.job_workflow import answer_follow_up_question
+
+        try:
+            return await asyncio.to_thread(answer_follow_up_question, state, question)
+        except LLMUnavailableError as e:
+            print(f"LLM unavailable for follow-up question: {str(e)}")
+            return "I can't answer that right now; please try again later."
@@ -1,15 +1,26 @@
-from typing import Dict
+import asyncio
+from typing import Dict, Optional
 
 from slack_bolt.app.async_app import AsyncApp
 from typing_extensions import Awaitable
 
+from src.parsers.resume_extractor import parse_facet_query
 from src.parsers.resume_parser import ResumeParser
-from src.slack.formatters import format_error_message
+from src.slack.formatters import format_error_message, format_job_matches
+from src.utils.profiler import SamplingProfiler
+from src.utils.startup import StartupState
 
 
 class ResumeHandler:
-    def __init__(self, resume_parser: ResumeParser):
+    def __init__(
+        self,
+        resume_parser: ResumeParser,
+        startup: Optional[StartupState] = None,
+        profiler: Optional[SamplingProfiler] = None,
+    ):
         self.resume_parser = resume_parser
+        self.startup = startup
+        self.profiler = profiler or SamplingProfiler()
 
     async def handle_upload_command(self, ack, body, client) -> None:
         """Handle /upload-resume command"""
@@ -48,21 +59,59 @@ class ResumeHandler:
 
     async def handle_submission(self, ack, body, client, view) -> None:
         """Handle resume upload submission"""
+        with self.profiler.track("resume_submission"):
+            await ack()
+            try:
+                user_id = body["user"]["id"]
+                if self.startup:
+                    await self.startup.wait_ready()
+
+                values = view["state"]["values"]
+                file_id = values["resume_block"]["resume_file"]["files"][0]
+
+                result = await client.files_info(file=file_id)
+                file_url = result["file"]["url_private"]
+
+                await self.resume_parser.save_resume(user_id, file_url)
+
+                await client.chat_postMessage(
+                    channel=user_id,
+                    text="✅ Your resume has been successfully uploaded and processed!",
+                )
+            except Exception as e:
+                await client.chat_postMessage(
+                    channel=user_id, text=format_error_message(str(e))
+                )
+
+    async def handle_find_command(self, ack, body, client) -> None:
+        """Handle /find-members, e.g. `/find-members Senior + Python + AWS`"""
         await ack()
         try:
-            user_id = body["user"]["id"]
-            file_id = view["state"]["values"]["resume_block"]["resume_file"]["files"][0]
-
-            result = await client.files_info(file=file_id)
-            file_url = result["file"]["url_private"]
+            if self.startup:
+                await self.startup.wait_ready()
 
-            await self.resume_parser.save_resume(user_id, file_url)
+            query = body.get("text", "").strip()
+            if not query:
+                text = "Usage: `/find-members Senior + Python + AWS`"
+            else:
+                facets = parse_facet_query(query)
+                matches = await asyncio.to_thread(
+                    self.resume_parser.query_members,
+                    facets["skills"],
+                    facets["experience_level"],
+                    facets["categories"],
+                )
+                if matches:
+                    text = format_job_matches(matches, heading=f"Members for {query}")
+                else:
+                    text = f"No members match {query}."
 
-            await client.chat_postMessage(
-                channel=user_id,
-                text="✅ Your resume has been successfully uploaded and processed!",
+            await client.chat_postEphemeral(
+                channel=body["channel_id"], user=body["user_id"], text=text
             )
         except Exception as e:
-            await client.chat_postMessage(
-                channel=user_id, text=format_error_message(str(e))
+            await client.chat_postEphemeral(
+                channel=body["channel_id"],
+                user=body["user_id"],
+                text=format_error_message(str(e)),
             )
@@ -0,0 +1,91 @@
+import json
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from src.models.schemas import WorkflowState
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    channel TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    state TEXT NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (channel, ts)
+);
+CREATE INDEX IF NOT EXISTS checkpoints_last_used ON checkpoints (last_used);
+"""
+
+
+class CheckpointStore:
+    """SQLite-backed workflow state per analyzed Slack message.
+
+    Thread replies resume from the stored state instead of re-running the
+    workflow. Checkpoints unused for ``max_age`` seconds are dropped, and only
+    the ``max_entries`` most recently used are kept.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_age: float = 30 * 24 * 3600,
+        max_entries: int = 5000,
+    ):
+        self.path = Path(path)
+        self.max_age = max_age
+        self.max_entries = max_entries
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per call so any thread can use the store
+        return sqlite3.connect(self.path, timeout=10)
+
+    def save(self, channel: str, ts: str, state: "WorkflowState") -> None:
+        """Checkpoint the final state of a workflow run"""
+        now = time.time()
+        # Chat history isn't JSON serializable and isn't needed to resume
+        payload = json.dumps({k: v for k, v in state.items() if k != "messages"})
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?)",
+                (channel, ts, payload, now, now),
+            )
+            self._prune(conn, now)
+
+    def load(self, channel: str, ts: str) -> Optional["WorkflowState"]:
+        """Load the checkpoint for a message, if it is still retained"""
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT state FROM checkpoints "
+                "WHERE channel = ? AND ts = ? AND last_used >= ?",
+                (channel, ts, now - self.max_age),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE checkpoints SET last_used = ? WHERE channel = ? AND ts = ?",
+                (now, channel, ts),
+            )
+
+        state = json.loads(row[0])
+        state["messages"] = []
+        return state
+
+    def _prune(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute(
+            "DELETE FROM checkpoints WHERE last_used < ?", (now - self.max_age,)
+        )
+        conn.execute(
+            "DELETE FROM checkpoints WHERE rowid NOT IN ("
+            "SELECT rowid FROM checkpoints ORDER BY last_used DESC LIMIT ?)",
+            (self.max_entries,),
+        )
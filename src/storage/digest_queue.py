@@ -0,0 +1,115 @@
+import json
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS digest_items (
+    recipient TEXT NOT NULL,
+    posting_key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created REAL NOT NULL,
+    claim_id TEXT,
+    claimed_until REAL,
+    PRIMARY KEY (recipient, posting_key)
+);
+"""
+
+# Columns added after the first release; older databases are migrated
+_LEASE_COLUMNS = {"claim_id": "TEXT", "claimed_until": "REAL"}
+
+
+class DigestQueue:
+    """Persistent per-recipient queue of pending digest entries.
+
+    Entries are keyed by recipient (a channel or member ID) and posting, so a
+    posting reposted before the next flush replaces its earlier entry instead
+    of appearing twice. Claimed entries stay in the queue under a lease until
+    they are acknowledged as sent, so a worker dying mid-flush loses nothing:
+    its entries are claimed again once the lease runs out.
+    """
+
+    def __init__(self, path: Path, lease: float = 900.0):
+        self.path = Path(path)
+        self.lease = lease
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            columns = {
+                row[1] for row in conn.execute("PRAGMA table_info(digest_items)")
+            }
+            for column, column_type in _LEASE_COLUMNS.items():
+                if column not in columns:
+                    conn.execute(
+                        f"ALTER TABLE digest_items ADD COLUMN {column} {column_type}"
+                    )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=10)
+
+    def enqueue(self, recipient: str, posting_key: str, payload: Dict) -> None:
+        """Add or replace a recipient's entry for a posting"""
+        with closing(self._connect()) as conn, conn:
+            # A replacement starts unclaimed, so a flush already sending the
+            # old entry won't acknowledge the new one away
+            conn.execute(
+                "INSERT OR REPLACE INTO digest_items "
+                "(recipient, posting_key, payload, created) VALUES (?, ?, ?, ?)",
+                (recipient, posting_key, json.dumps(payload), time.time()),
+            )
+
+    def claim_all(self) -> Tuple[str, Dict[str, List[Dict]]]:
+        """Lease every unclaimed or expired entry, grouped by recipient.
+
+        Returns the claim ID along with the entries. Concurrent workers never
+        claim the same entries while a lease is live; call ack() after sending
+        a recipient's digest and release() if sending failed.
+        """
+        claim_id = uuid.uuid4().hex
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.isolation_level = None
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "UPDATE digest_items SET claim_id = ?, claimed_until = ? "
+                    "WHERE claim_id IS NULL OR claimed_until < ?",
+                    (claim_id, now + self.lease, now),
+                )
+                rows = conn.execute(
+                    "SELECT recipient, posting_key, payload, created "
+                    "FROM digest_items WHERE claim_id = ? ORDER BY created",
+                    (claim_id,),
+                ).fetchall()
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+        pending: Dict[str, List[Dict]] = {}
+        for recipient, posting_key, payload, created in rows:
+            pending.setdefault(recipient, []).append(
+                {"posting_key": posting_key, "created": created, **json.loads(payload)}
+            )
+        return claim_id, pending
+
+    def ack(self, recipient: str, claim_id: str) -> None:
+        """Delete a recipient's claimed entries once their digest was sent"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "DELETE FROM digest_items WHERE recipient = ? AND claim_id = ?",
+                (recipient, claim_id),
+            )
+
+    def release(self, recipient: str, claim_id: str) -> None:
+        """Return a recipient's claimed entries to the queue after a failed send"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "UPDATE digest_items SET claim_id = NULL, claimed_until = NULL "
+                "WHERE recipient = ? AND claim_id = ?",
+                (recipient, claim_id),
+            )
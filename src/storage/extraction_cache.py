@@ -0,0 +1,73 @@
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Iterable
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS extractions (
+    text_hash TEXT NOT NULL,
+    extractor TEXT NOT NULL,
+    profile TEXT NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (text_hash, extractor)
+);
+"""
+
+# SQLite's default limit on host parameters per statement is 999
+_CHUNK = 500
+
+
+def text_hash(text: str) -> str:
+    """Content key for resume text"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ExtractionCache:
+    """SQLite-backed resume profiles keyed by text hash and extractor.
+
+    Re-uploading an unchanged resume, or re-indexing every resume after a
+    restart, reuses the stored profile instead of parsing the text again.
+    The extractor name keeps profiles from different extractors (or
+    extractor versions) apart.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=10)
+
+    def get_many(self, hashes: Iterable[str], extractor: str) -> Dict[str, Dict]:
+        """Cached profiles for the given text hashes; misses are left out"""
+        hashes = list(dict.fromkeys(hashes))
+        found: Dict[str, Dict] = {}
+        with closing(self._connect()) as conn:
+            for i in range(0, len(hashes), _CHUNK):
+                chunk = hashes[i : i + _CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    "SELECT text_hash, profile FROM extractions "
+                    f"WHERE extractor = ? AND text_hash IN ({placeholders})",
+                    (extractor, *chunk),
+                ).fetchall()
+                found.update((key, json.loads(profile)) for key, profile in rows)
+        return found
+
+    def put_many(self, profiles: Dict[str, Dict], extractor: str) -> None:
+        """Store profiles keyed by text hash"""
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO extractions VALUES (?, ?, ?, ?)",
+                [
+                    (key, extractor, json.dumps(profile), now)
+                    for key, profile in profiles.items()
+                ],
+            )
@@ -0,0 +1,139 @@
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from src.parsers.skill_taxonomy import skill_category
+
+_UNSPECIFIED = "Not specified"
+
+
+class MemberFacetIndex:
+    """Columnar in-memory index of member profiles for faceted queries.
+
+    Every member gets a row number, and each skill, skill category and
+    experience level is stored as a column: a bitset (a Python int) with one
+    bit per row. A query like "Senior + Python + AWS" is then a handful of
+    integer ANDs over the whole roster instead of a scan over every member's
+    dict. Freed rows are reused so the bitsets stay dense.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._user_ids: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._free: List[int] = []
+
+        self._live = 0
+        self._by_skill: Dict[str, int] = {}
+        self._by_category: Dict[str, int] = {}
+        self._by_level: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def rebuild(self, members: Dict[str, Dict]) -> None:
+        """Replace the index contents with ``members``"""
+        with self._lock:
+            self._reset()
+            for user_id, record in members.items():
+                self._insert(user_id, record)
+
+    def update(self, user_id: str, record: Dict) -> None:
+        """Add or replace a member's row"""
+        with self._lock:
+            self._remove(user_id)
+            self._insert(user_id, record)
+
+    def remove(self, user_id: str) -> None:
+        with self._lock:
+            self._remove(user_id)
+
+    def any_skill(self, skills: Iterable[str]) -> List[str]:
+        """Members with at least one of the given skills (exact spelling)"""
+        with self._lock:
+            rows = 0
+            for skill in skills:
+                rows |= self._by_skill.get(skill, 0)
+            return self._users(rows)
+
+    def query(
+        self,
+        skills: Iterable[str] = (),
+        experience_level: Optional[str] = None,
+        categories: Iterable[str] = (),
+        match_all: bool = True,
+    ) -> List[str]:
+        """Members matching every facet.
+
+        ``skills`` must all match, or with ``match_all=False`` any one of them;
+        ``categories`` likewise. Skill and category names ignore case.
+        """
+        with self._lock:
+            rows = self._live
+            if experience_level is not None:
+                rows &= self._lookup(self._by_level, experience_level)
+            rows &= self._combine(self._by_skill, skills, match_all)
+            rows &= self._combine(self._by_category, categories, match_all)
+            return self._users(rows)
+
+    def _combine(
+        self, bitsets: Dict[str, int], names: Iterable[str], match_all: bool
+    ) -> int:
+        names = list(names)
+        if not names:
+            return self._live
+        combined = self._live if match_all else 0
+        for name in names:
+            bits = self._lookup(bitsets, name)
+            combined = combined & bits if match_all else combined | bits
+        return combined
+
+    @staticmethod
+    def _lookup(bitsets: Dict[str, int], name: str) -> int:
+        bits = bitsets.get(name)
+        if bits is None:
+            lowered = name.lower()
+            bits = next((b for k, b in bitsets.items() if k.lower() == lowered), 0)
+        return bits
+
+    def _users(self, rows: int) -> List[str]:
+        users = []
+        while rows:
+            low = rows & -rows
+            users.append(self._user_ids[low.bit_length() - 1])
+            rows ^= low
+        return users
+
+    def _insert(self, user_id: str, record: Dict) -> None:
+        if self._free:
+            row = self._free.pop()
+            self._user_ids[row] = user_id
+        else:
+            row = len(self._user_ids)
+            self._user_ids.append(user_id)
+        self._rows[user_id] = row
+        bit = 1 << row
+
+        level = record.get("experience_level") or _UNSPECIFIED
+        self._live |= bit
+        self._by_level[level] = self._by_level.get(level, 0) | bit
+        for skill in record.get("skills", []):
+            self._by_skill[skill] = self._by_skill.get(skill, 0) | bit
+            category = skill_category(skill)
+            self._by_category[category] = self._by_category.get(category, 0) | bit
+
+    def _remove(self, user_id: str) -> None:
+        row = self._rows.pop(user_id, None)
+        if row is None:
+            return
+        mask = ~(1 << row)
+        self._live &= mask
+        for bitsets in (self._by_skill, self._by_category, self._by_level):
+            for name in [name for name, bits in bitsets.items() if bits & ~mask]:
+                bitsets[name] &= mask
+                if not bitsets[name]:
+                    del bitsets[name]
+        self._user_ids[row] = None
+        self._free.append(row)
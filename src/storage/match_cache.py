@@ -0,0 +1,92 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+MatchResult = Dict[str, List[str]]
+
+
+class MatchCache:
+    """Bounded LRU cache of member match results.
+
+    Keyed by the required skill set (order and duplicates ignored). A change
+    to a member evicts just the entries whose skill sets overlap that
+    member's old or new skills. Every invalidation also bumps a generation
+    number; a result is only stored if no invalidation happened since the
+    generation it was computed at, checked under the cache lock.
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._entries: "OrderedDict[FrozenSet[str], MatchResult]" = OrderedDict()
+
+    @staticmethod
+    def key(required_skills: Iterable[str]) -> FrozenSet[str]:
+        return frozenset(required_skills)
+
+    @property
+    def generation(self) -> int:
+        """Read before the member index when computing a result to cache"""
+        with self._lock:
+            return self._generation
+
+    def get(self, key: FrozenSet[str]) -> Optional[MatchResult]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return {user_id: list(skills) for user_id, skills in result.items()}
+
+    def put(
+        self,
+        key: FrozenSet[str],
+        result: MatchResult,
+        generation: int,
+    ) -> None:
+        """Cache a result computed at ``generation`` unless it was invalidated since"""
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = {
+                user_id: list(skills) for user_id, skills in result.items()
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, skills: Iterable[str]) -> None:
+        """Evict cached queries that a member with these skills could affect"""
+        skills = set(skills)
+        with self._lock:
+            self._generation += 1
+            stale = [key for key in self._entries if not key.isdisjoint(skills)]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,226 @@
+import hashlib
+import json
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+# Sketch layout: one-permutation MinHash with NUM_BINS bins, banded for LSH.
+# 16 bands of 4 rows surface candidates from roughly 0.5 Jaccard upward; the
+# configured threshold is then checked against the sketch estimate.
+NUM_BINS = 64
+ROWS_PER_BAND = 4
+SHINGLE_SIZE = 3
+_EMPTY_BIN = 1 << 64
+
+_MONEY_PATTERN = re.compile(r"[$€£]\s?\d[\d,.]*\s?[kK]?")
+_YEARS_PATTERN = re.compile(r"\b\d+\+?\s*(?:-\s*\d+\s*)?years?\b", re.IGNORECASE)
+_DATE_PATTERN = re.compile(
+    r"\b(?:\d{1,2}/\d{1,2}(?:/\d{2,4})?|"
+    r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+\d{1,2})\b",
+    re.IGNORECASE,
+)
+_URL_PATTERN = re.compile(r"https?://\S+")
+
+
+@dataclass(frozen=True)
+class PostingMatch:
+    """A previously analyzed posting similar to the one being looked up"""
+
+    similarity: float
+    key_fields_match: bool
+    results: Dict
+    recommendations: List[str]
+
+
+def normalize_posting(text: str) -> str:
+    """Lowercase and strip emoji, markup and bullet formatting"""
+    text = _URL_PATTERN.sub(" ", text.lower())
+    text = re.sub(r"[^a-z0-9+#$.\s]", " ", text)
+    text = re.sub(r"(?<!\w)\.|\.(?!\w)", " ", text)
+    return " ".join(text.split())
+
+
+def extract_key_fields(text: str) -> Dict[str, List[str]]:
+    """Fields that change the detailed analysis when a repost edits them"""
+    lines = [normalize_posting(line) for line in text.splitlines()]
+    headline = next((line for line in lines if line), "")
+    return {
+        "headline": [headline],
+        "salary": sorted(
+            m.replace(" ", "").lower() for m in _MONEY_PATTERN.findall(text)
+        ),
+        "experience": sorted(
+            " ".join(m.lower().split()) for m in _YEARS_PATTERN.findall(text)
+        ),
+        "dates": sorted(m.lower() for m in _DATE_PATTERN.findall(text)),
+        "links": sorted(_URL_PATTERN.findall(text)),
+    }
+
+
+def _shingles(normalized: str) -> Set[str]:
+    words = normalized.split()
+    if len(words) <= SHINGLE_SIZE:
+        return {" ".join(words)}
+    return {
+        " ".join(words[i : i + SHINGLE_SIZE])
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    }
+
+
+def minhash_signature(normalized: str) -> List[int]:
+    """One-permutation MinHash: one hash per shingle, minimum kept per bin"""
+    signature = [_EMPTY_BIN] * NUM_BINS
+    for shingle in _shingles(normalized):
+        h = int.from_bytes(
+            hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        bin_index, value = h % NUM_BINS, h // NUM_BINS
+        if value < signature[bin_index]:
+            signature[bin_index] = value
+    return signature
+
+
+def estimate_similarity(a: List[int], b: List[int]) -> float:
+    """Estimate Jaccard similarity from two signatures, ignoring bins empty in both"""
+    used = matches = 0
+    for x, y in zip(a, b):
+        if x == _EMPTY_BIN and y == _EMPTY_BIN:
+            continue
+        used += 1
+        matches += x == y
+    return matches / used if used else 1.0
+
+
+class PostingIndex:
+    """Similarity index over previously analyzed job postings.
+
+    Postings are appended to a JSON-lines file so analyses survive restarts
+    and are shared with other workers. Only signatures, key fields and file
+    offsets are held in memory; analysis results are read back on a hit.
+    """
+
+    def __init__(self, path: Path, threshold: float = 0.85):
+        self.path = Path(path)
+        self.threshold = threshold
+
+        self._lock = threading.Lock()
+        self._offset = 0
+        self._exact: Dict[str, int] = {}
+        self._signatures: List[List[int]] = []
+        self._key_fields: List[Dict] = []
+        self._offsets: List[int] = []
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [
+            {} for _ in range(NUM_BINS // ROWS_PER_BAND)
+        ]
+
+        # Existing postings are indexed on the first refresh or lookup
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def lookup(self, text: str) -> Optional[PostingMatch]:
+        """Find the most similar stored posting at or above the threshold"""
+        self.refresh()
+        normalized = normalize_posting(text)
+        key_fields = extract_key_fields(text)
+
+        entry_id = self._exact.get(self._digest(normalized))
+        if entry_id is not None:
+            similarity = 1.0
+        else:
+            entry_id, similarity = self._best_candidate(minhash_signature(normalized))
+            if entry_id is None or similarity < self.threshold:
+                return None
+
+        entry = self._read_entry(self._offsets[entry_id])
+        return PostingMatch(
+            similarity=similarity,
+            key_fields_match=key_fields == self._key_fields[entry_id],
+            results=entry["results"],
+            recommendations=entry["recommendations"],
+        )
+
+    def add(self, text: str, results: Dict, recommendations: List[str]) -> None:
+        """Store an analyzed posting"""
+        normalized = normalize_posting(text)
+        entry = {
+            "digest": self._digest(normalized),
+            "signature": minhash_signature(normalized),
+            "key_fields": extract_key_fields(text),
+            "results": results,
+            "recommendations": recommendations,
+            "created": datetime.now().isoformat(),
+        }
+        # A single O_APPEND write keeps concurrent workers' lines intact
+        with open(self.path, "ab") as f:
+            f.write(json.dumps(entry).encode("utf-8") + b"\n")
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Index postings appended since the last refresh, by us or other workers"""
+        with self._lock:
+            try:
+                size = self.path.stat().st_size
+            except FileNotFoundError:
+                return
+            if size == self._offset:
+                return
+
+            with open(self.path, "rb") as f:
+                f.seek(self._offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    entry = json.loads(line)
+                    self._index(entry, self._offset)
+                    self._offset += len(line)
+
+    def _index(self, entry: Dict, offset: int) -> None:
+        entry_id = len(self._signatures)
+        self._signatures.append(entry["signature"])
+        self._key_fields.append(entry["key_fields"])
+        self._offsets.append(offset)
+        self._exact[entry["digest"]] = entry_id
+        for band, key in self._band_keys(entry["signature"]):
+            self._buckets[band].setdefault(key, []).append(entry_id)
+
+    def _best_candidate(self, signature: List[int]) -> Tuple[Optional[int], float]:
+        candidates: Set[int] = set()
+        for band, key in self._band_keys(signature):
+            candidates.update(self._buckets[band].get(key, ()))
+
+        best_id, best_similarity = None, 0.0
+        for entry_id in sorted(candidates):
+            similarity = estimate_similarity(signature, self._signatures[entry_id])
+            # Prefer the newest analysis on ties
+            if similarity >= best_similarity:
+                best_id, best_similarity = entry_id, similarity
+        return best_id, best_similarity
+
+    def _read_entry(self, offset: int) -> Dict:
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    @staticmethod
+    def _band_keys(signature: List[int]) -> List[Tuple[int, Tuple[int, ...]]]:
+        """(band, key) pairs for LSH bucketing.
+
+        Short postings leave most bins empty; bands with no filled bin would
+        all share one key and put every short posting in the same bucket, so
+        they are skipped. Every signature has at least one filled bin.
+        """
+        keys = []
+        for band, i in enumerate(range(0, NUM_BINS, ROWS_PER_BAND)):
+            key = tuple(signature[i : i + ROWS_PER_BAND])
+            if any(value != _EMPTY_BIN for value in key):
+                keys.append((band, key))
+        return keys
+
+    @staticmethod
+    def _digest(normalized: str) -> str:
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
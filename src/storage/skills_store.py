@@ -0,0 +1,302 @@
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: only in-process locking is available
+    fcntl = None
+
+
+@dataclass(frozen=True)
+class StoreChange:
+    """A committed change to the skills store.
+
+    ``user_id`` is None when the change log could not be followed (e.g. it was
+    compacted past this reader) and listeners should reload everything.
+    """
+
+    version: int
+    user_id: Optional[str]
+    record: Optional[Dict]
+
+
+ChangeListener = Callable[[StoreChange], None]
+
+
+class SkillsStore:
+    """Concurrency-safe skills database shared by every bot worker.
+
+    The database stays a plain ``{user_id: record}`` JSON file. Writes take an
+    exclusive ``flock`` on a sidecar lock file, append the change to a journal,
+    then atomically replace the database, so concurrent workers never lose
+    updates and readers never see a half-written file. Other workers follow
+    the journal to refresh their in-memory indexes incrementally.
+    """
+
+    def __init__(self, path: Path, journal_limit: int = 1000):
+        self.path = Path(path)
+        self.lock_path = self.path.with_suffix(".lock")
+        self.journal_path = self.path.with_suffix(".journal")
+        self.journal_limit = journal_limit
+
+        self._thread_lock = threading.Lock()
+        self._task_locks: Dict[str, threading.Lock] = {}
+        self._reader_lock = threading.RLock()
+        self._listeners: List[ChangeListener] = []
+        self._version = 0
+        self._journal_offset = 0
+        self._journal_inode: Optional[int] = None
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._locked(exclusive=True):
+            if not self.path.exists():
+                self._atomic_write({})
+
+    @property
+    def version(self) -> int:
+        """Latest store version this process has observed"""
+        return self._version
+
+    def subscribe(self, listener: ChangeListener) -> None:
+        """Register a callback for changes made by this or any other worker"""
+        self._listeners.append(listener)
+
+    def read_all(self) -> Dict[str, Dict]:
+        """Read a consistent snapshot of the database"""
+        with self._locked(exclusive=False):
+            return self._read_db()
+
+    def load(self) -> Dict[str, Dict]:
+        """Read a snapshot and follow the journal from that point on"""
+        with self._reader_lock:
+            with self._locked(exclusive=False):
+                db = self._read_db()
+                self._version = self._db_version(db)
+                self._journal_inode, self._journal_offset = None, 0
+                self._read_journal()
+            return db
+
+    def get(self, user_id: str) -> Optional[Dict]:
+        """Get a single member record"""
+        return self.read_all().get(user_id)
+
+    def upsert(self, user_id: str, fields: Dict) -> Dict:
+        """Atomically create or replace a member record and return it"""
+        with self._locked(exclusive=True):
+            db = self._read_db()
+            version, journal_size = self._recover(db)
+            record = {
+                **fields,
+                "last_updated": datetime.now().isoformat(),
+                "version": version + 1,
+            }
+            db[user_id] = record
+
+            self._append_journal(
+                {"version": record["version"], "user_id": user_id, "record": record}
+            )
+            self._atomic_write(db)
+            if journal_size + 1 > self.journal_limit:
+                self._compact_journal()
+
+        self.refresh()
+        return record
+
+    def refresh(self) -> List[StoreChange]:
+        """Pick up changes committed since the last refresh and notify listeners.
+
+        Cheap when nothing changed: a single ``stat`` of the journal.
+        """
+        # Listeners run under the reader lock so they see changes in order
+        with self._reader_lock:
+            changes = self._read_journal()
+            for change in changes:
+                for listener in self._listeners:
+                    listener(change)
+        return changes
+
+    @contextmanager
+    def exclusive_task(self, name: str) -> Iterator[bool]:
+        """Try to become the only worker running the task ``name``.
+
+        Yields whether this worker got it; never waits. Uses its own lock
+        file, so a long task doesn't hold up reads and writes of the store.
+        """
+        thread_lock = self._task_locks.setdefault(name, threading.Lock())
+        if not thread_lock.acquire(blocking=False):
+            yield False
+            return
+        try:
+            if fcntl is None:
+                yield True
+                return
+            with open(self.path.with_suffix(f".{name}.lock"), "a+") as lock_file:
+                try:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    yield False
+                    return
+                try:
+                    yield True
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        finally:
+            thread_lock.release()
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        """Hold the in-process lock and the cross-process file lock"""
+        with self._thread_lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.lock_path, "a+") as lock_file:
+                fcntl.flock(
+                    lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+                )
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _read_db(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _atomic_write(self, db: Dict[str, Dict]) -> None:
+        """Write to a temp file in the same directory, fsync, then rename over"""
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(db, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _db_version(db: Dict[str, Dict]) -> int:
+        return max((record.get("version", 0) for record in db.values()), default=0)
+
+    def _iter_journal(self) -> Iterator[Dict]:
+        try:
+            with open(self.journal_path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue  # corrupted by a crashed writer; skip it
+        except FileNotFoundError:
+            return
+
+    def _append_journal(self, entry: Dict) -> None:
+        with open(self.journal_path, "a+b") as f:
+            self._truncate_partial_line(f)
+            f.write(json.dumps(entry).encode("utf-8") + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def _truncate_partial_line(f) -> None:
+        """Drop a trailing entry left unterminated by a writer that crashed.
+
+        Must be called under the exclusive lock, before appending, so the
+        next entry starts on its own line.
+        """
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - 4096)
+            f.seek(start)
+            chunk = f.read(position - start)
+            newline = chunk.rfind(b"\n")
+            if newline != -1:
+                position = start + newline + 1
+                break
+            position = start
+        if position != end:
+            f.truncate(position)
+        f.seek(0, os.SEEK_END)
+
+    def _recover(self, db: Dict[str, Dict]) -> Tuple[int, int]:
+        """Re-apply journal entries a crashed writer logged but never committed.
+
+        Returns the latest committed version and the journal length.
+        """
+        version = self._db_version(db)
+        journal_size = 0
+        for entry in self._iter_journal():
+            journal_size += 1
+            current = db.get(entry["user_id"], {})
+            if entry["version"] > current.get("version", 0):
+                db[entry["user_id"]] = entry["record"]
+            version = max(version, entry["version"])
+        return version, journal_size
+
+    def _compact_journal(self) -> None:
+        """Keep only the newest half of the journal; readers that fall behind reload"""
+        entries = list(self._iter_journal())[-(self.journal_limit // 2) :]
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.journal_path.name}.", suffix=".tmp"
+        )
+        with os.fdopen(fd, "wb") as f:
+            for entry in entries:
+                f.write(json.dumps(entry).encode("utf-8") + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.journal_path)
+
+    def _read_journal(self) -> List[StoreChange]:
+        """Read journal entries past this reader's offset"""
+        try:
+            stat = self.journal_path.stat()
+        except FileNotFoundError:
+            return []
+
+        if stat.st_ino != self._journal_inode or stat.st_size < self._journal_offset:
+            # First read, or the journal was compacted: rescan from the start
+            self._journal_inode, self._journal_offset = stat.st_ino, 0
+        if stat.st_size == self._journal_offset:
+            return []
+
+        changes = []
+        with open(self.journal_path, "rb") as f:
+            f.seek(self._journal_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # entry still being written; pick it up next time
+                self._journal_offset += len(line)
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # corrupted by a crashed writer; skip it
+                if entry["version"] <= self._version:
+                    continue
+                if entry["version"] > self._version + 1:
+                    # Entries we never saw were compacted away
+                    changes = [StoreChange(entry["version"], None, None)]
+                else:
+                    changes.append(
+                        StoreChange(entry["version"], entry["user_id"], entry["record"])
+                    )
+                self._version = entry["version"]
+
+        if changes and changes[0].user_id is None:
+            return [StoreChange(self._version, None, None)]
+        return changes
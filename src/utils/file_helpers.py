@@ -1,6 +1,34 @@
 import os
 from pathlib import Path
-from typing import BinaryIO
+from typing import BinaryIO, Dict, Optional, Union
 
 import aiohttp
-import PyPDF2
+
+
+async def save_file(
+    url: str, destination: Path, headers: Optional[Dict[str, str]] = None
+) -> Path:
+    """Download a file and save it to disk"""
+    destination = Path(destination)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+
+    async with aiohttp.ClientSession(headers=headers) as session:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            content = await response.read()
+
+    with open(destination, "wb") as f:
+        f.write(content)
+    return destination
+
+
+def read_pdf_content(file: Union[str, os.PathLike, BinaryIO]) -> str:
+    """Extract the text of every page in a PDF"""
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb") as f:
+            return read_pdf_content(f)
+
+    import PyPDF2
+
+    reader = PyPDF2.PdfReader(file)
+    return "".join(page.extract_text() or "" for page in reader.pages)
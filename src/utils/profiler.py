@@ -0,0 +1,150 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Dict, Iterator, List, Optional
+
+# Leaf frames of threads parked waiting for work; dropped so the profile
+# shows where time is actually spent
+_IDLE_FRAMES = {
+    ("threading.py", "wait"),
+    ("selectors.py", "select"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+}
+
+_DISABLED = nullcontext()
+
+
+class SamplingProfiler:
+    """On-demand wall-clock sampling profiler.
+
+    While running, a background thread snapshots every thread's Python stack
+    every ``interval`` seconds; the event loop, Bolt listeners, spaCy, PyPDF2
+    and LLM worker threads all show up. Handlers wrapped in :meth:`track` also
+    get per-invocation timings. When stopped there is no sampler thread and
+    :meth:`track` is a shared no-op context manager.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self.task_times: Dict[str, List[float]] = {}
+
+        self._active = False
+        self._deadline: Optional[float] = None
+        self._max_events: Optional[int] = None
+        self._events = 0
+        self._started_at = 0.0
+        self._elapsed = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._done: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    def start(
+        self, duration: Optional[float] = None, max_events: Optional[int] = None
+    ) -> bool:
+        """Start profiling for ``duration`` seconds or the next ``max_events`` events.
+
+        Must be called from the event loop. Returns False if already running.
+        """
+        if self._active:
+            return False
+
+        self.samples = Counter()
+        self.task_times = {}
+        self._events = 0
+        self._max_events = max_events
+        self._started_at = time.perf_counter()
+        self._deadline = self._started_at + duration if duration is not None else None
+        self._stop.clear()
+        self._loop = asyncio.get_running_loop()
+        self._done = asyncio.Event()
+
+        self._active = True
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    async def wait(self) -> None:
+        """Wait for the current profile to finish"""
+        if self._done is not None:
+            await self._done.wait()
+
+    def track(self, name: str) -> ContextManager:
+        """Time a handler invocation while profiling"""
+        if not self._active:
+            return _DISABLED
+        return self._track(name)
+
+    @contextmanager
+    def _track(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.task_times.setdefault(name, []).append(time.perf_counter() - start)
+            self._events += 1
+            if self._max_events and self._events >= self._max_events:
+                self.stop()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self._sample(own_id)
+            if self._deadline is not None and time.perf_counter() >= self._deadline:
+                break
+
+        self._elapsed = time.perf_counter() - self._started_at
+        self._active = False
+        self._loop.call_soon_threadsafe(self._done.set)
+
+    def _sample(self, own_id: int) -> None:
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            code = frame.f_code
+            if (os.path.basename(code.co_filename), code.co_name) in _IDLE_FRAMES:
+                continue
+
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)})")
+                frame = frame.f_back
+            stack.append(thread_names.get(thread_id, "thread"))
+            self.samples[";".join(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        """Samples in collapsed-stack format, ready for flamegraph.pl or speedscope"""
+        return "\n".join(
+            f"{stack} {count}" for stack, count in self.samples.most_common()
+        )
+
+    def summary(self) -> str:
+        """Human-readable handler timings"""
+        lines = [
+            f"*Profile:* {sum(self.samples.values())} samples over "
+            f"{self._elapsed:.1f}s, {self._events} events"
+        ]
+        for name, durations in sorted(self.task_times.items()):
+            ordered = sorted(durations)
+            mean = sum(ordered) / len(ordered)
+            p95 = ordered[int(0.95 * (len(ordered) - 1))]
+            lines.append(
+                f"• `{name}` x{len(ordered)}: mean {mean * 1000:.0f} ms, "
+                f"p95 {p95 * 1000:.0f} ms, max {ordered[-1] * 1000:.0f} ms"
+            )
+        return "\n".join(lines)
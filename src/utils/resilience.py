@@ -0,0 +1,202 @@
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Deque, Dict, Optional
+
+
+class LLMUnavailableError(Exception):
+    """Raised when an LLM call can't complete within its deadline"""
+
+
+class CircuitOpenError(LLMUnavailableError):
+    """Raised without calling the provider while the circuit is open"""
+
+
+def is_transient(error: Exception) -> bool:
+    """Whether retrying the call could succeed"""
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    status = getattr(error, "status_code", None)
+    if status is not None:
+        return status == 429 or status >= 500
+    # openai raises these without a status code
+    return type(error).__name__ in {"APITimeoutError", "APIConnectionError"}
+
+
+class CircuitBreaker:
+    """Fail fast after repeated provider failures.
+
+    Opens after ``failure_threshold`` consecutive transient failures, then lets
+    a single probe call through once ``reset_timeout`` seconds have passed.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probe_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+
+class ResilientLLM:
+    """Chat model wrapper with deadlines, retries, hedging and a circuit breaker.
+
+    Each call gets the deadline configured for its workflow node. Transient
+    errors are retried with full-jitter exponential backoff inside that
+    deadline. With hedging on, a duplicate request is sent once the first has
+    been outstanding longer than the node's recent p95 latency, and whichever
+    answers first wins.
+    """
+
+    def __init__(
+        self,
+        llm,
+        deadlines: Dict[str, float],
+        default_deadline: float = 30.0,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 4.0,
+        hedge: bool = False,
+        breaker: Optional[CircuitBreaker] = None,
+        max_workers: int = 16,
+    ):
+        self.llm = llm
+        self.deadlines = deadlines
+        self.default_deadline = default_deadline
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.hedge = hedge
+        self.breaker = breaker or CircuitBreaker()
+        self.hedged_requests = 0
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="llm"
+        )
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._latencies_lock = threading.Lock()
+
+    def invoke(self, messages, node: str):
+        """Call the model for a workflow node"""
+        deadline = time.monotonic() + self.deadlines.get(node, self.default_deadline)
+        last_error: Optional[Exception] = None
+
+        for attempt in range(self.max_attempts):
+            if not self.breaker.allow():
+                raise CircuitOpenError(f"LLM circuit is open; skipped {node}")
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                response = self._attempt(messages, node, remaining)
+            except Exception as e:
+                if not is_transient(e):
+                    self.breaker.record_success()  # the provider did answer
+                    raise
+                self.breaker.record_failure()
+                last_error = e
+            else:
+                self.breaker.record_success()
+                return response
+
+            backoff = random.uniform(
+                0, min(self.backoff_cap, self.backoff_base * 2**attempt)
+            )
+            time.sleep(min(backoff, max(0.0, deadline - time.monotonic())))
+
+        raise LLMUnavailableError(
+            f"{node} failed within its deadline: {last_error}"
+        ) from last_error
+
+    def p95_latency(self, node: str) -> Optional[float]:
+        """Recent p95 latency of successful calls for a node"""
+        with self._latencies_lock:
+            samples = sorted(self._latencies.get(node, ()))
+        if len(samples) < 20:
+            return None
+        return samples[int(0.95 * (len(samples) - 1))]
+
+    def _attempt(self, messages, node: str, timeout: float):
+        """One logical attempt, possibly hedged, bounded by ``timeout``"""
+        start = time.monotonic()
+        end = start + timeout
+        pending = {self._submit(messages, node)}
+        p95 = self.p95_latency(node) if self.hedge else None
+        hedge_at = start + p95 if p95 is not None and p95 < timeout else None
+        error: Optional[BaseException] = None
+
+        while pending:
+            now = time.monotonic()
+            if now >= end:
+                break
+            until = min(end, hedge_at) if hedge_at is not None else end
+
+            done, pending = wait(
+                pending, timeout=max(0.0, until - now), return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+
+            if hedge_at is not None and pending and time.monotonic() >= hedge_at:
+                # First request is slower than usual: race a duplicate
+                pending.add(self._submit(messages, node))
+                self.hedged_requests += 1
+                hedge_at = None
+
+        if pending or error is None:
+            # Requests still queued in the executor would otherwise run later
+            # against a provider we've already given up on
+            for future in pending:
+                future.cancel()
+            raise TimeoutError(f"{node} exceeded its {timeout:.1f}s deadline")
+        raise error
+
+    def _submit(self, messages, node: str) -> Future:
+        return self._executor.submit(self._timed_invoke, messages, node)
+
+    def _timed_invoke(self, messages, node: str):
+        start = time.monotonic()
+        response = self.llm.invoke(messages)
+        with self._latencies_lock:
+            self._latencies.setdefault(node, deque(maxlen=200)).append(
+                time.monotonic() - start
+            )
+        return response
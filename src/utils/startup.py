@@ -0,0 +1,69 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Tuple
+
+
+class StartupState:
+    """Readiness signal and timing profile for bot startup.
+
+    Events that arrive while models and clients are still warming up wait on
+    :meth:`wait_ready` instead of failing.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+        self.queued_events = 0
+        self.ready_after = None
+        self._ready = asyncio.Event()
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Record how long a startup phase takes"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    async def warm_up(self, steps: List[Tuple[str, Callable[[], object]]]) -> None:
+        """Run blocking warm-up steps off the event loop, then mark ready"""
+        try:
+            for name, step in steps:
+                with self.phase(f"warm-up: {name}"):
+                    try:
+                        await asyncio.to_thread(step)
+                    except Exception as e:
+                        # Handlers load lazily on first use anyway; one failed
+                        # step shouldn't skip the others or hold events back
+                        print(f"Warm-up step {name} failed, continuing: {str(e)}")
+        finally:
+            self.mark_ready()
+
+    def mark_ready(self) -> None:
+        if self.ready_after is None:
+            self.ready_after = time.perf_counter() - self.started_at
+        self._ready.set()
+        print(self.report())
+
+    async def wait_ready(self) -> None:
+        """Wait until warm-up has finished"""
+        if self._ready.is_set():
+            return
+        self.queued_events += 1
+        await self._ready.wait()
+
+    def report(self) -> str:
+        """Format the startup profile"""
+        lines = ["Startup profile:"]
+        for name, seconds in self.phases:
+            lines.append(f"  {name:<32} {seconds * 1000:8.1f} ms")
+        if self.ready_after is not None:
+            lines.append(f"  {'ready after':<32} {self.ready_after * 1000:8.1f} ms")
+        lines.append(f"  {'events queued during warm-up':<32} {self.queued_events:8d}")
+        return "\n".join(lines)
@@ -0,0 +1,77 @@
+import re
+from typing import TYPE_CHECKING, List, Optional
+
+from src.parsers.resume_parser import ResumeParser
+from src.slack.formatters import format_job_matches, format_skill_list
+
+if TYPE_CHECKING:
+    from src.models.schemas import WorkflowState
+
+_WHO_KNOWS = re.compile(
+    r"\bwho(?:\s+else)?\s+(?:knows|has|uses|can do|is good at|works with)\s+(.+)",
+    re.IGNORECASE,
+)
+_SKILL_SEPARATORS = re.compile(r",|/|&|\band\b|\bor\b", re.IGNORECASE)
+_QUESTION_START = re.compile(
+    r"^\s*(?:who|what|which|when|where|why|how|is|are|does|do|can|could|should|"
+    r"would|will|any|show|list|tell)\b",
+    re.IGNORECASE,
+)
+
+
+def _parse_skills(text: str) -> List[str]:
+    text = text.strip().rstrip("?.!")
+    return [skill.strip() for skill in _SKILL_SEPARATORS.split(text) if skill.strip()]
+
+
+def is_question(text: str) -> bool:
+    """Whether a thread reply asks something, as opposed to "thanks!" etc."""
+    return "?" in text or bool(_QUESTION_START.match(text))
+
+
+def _members_with(resume_parser: ResumeParser, skills: List[str], heading: str) -> str:
+    matches = resume_parser.find_matching_members(resume_parser.resolve_skills(skills))
+    if not matches:
+        return f"No members found with {', '.join(skills)}."
+    return format_job_matches(matches, heading)
+
+
+def answer_follow_up(
+    state: "WorkflowState", question: str, resume_parser: ResumeParser
+) -> Optional[str]:
+    """Answer a thread reply from a checkpointed analysis without any LLM calls.
+
+    Returns None for questions that need the LLM follow-up node.
+    """
+    details = state["analysis_results"].get("details", {})
+    question_lower = question.lower()
+
+    who_knows = _WHO_KNOWS.search(question)
+    if who_knows:
+        skills = _parse_skills(who_knows.group(1))
+        return _members_with(resume_parser, skills, "Members")
+
+    if "preferred" in question_lower:
+        preferred = details.get("preferred_skills", [])
+        response = [format_skill_list("Preferred Skills", preferred)]
+        if preferred:
+            response.append(
+                _members_with(resume_parser, preferred, "Members With Preferred Skills")
+            )
+        return "\n".join(response)
+
+    if "required" in question_lower or "requirement" in question_lower:
+        return format_skill_list("Required Skills", details.get("required_skills", []))
+
+    if "responsibilit" in question_lower:
+        return format_skill_list(
+            "Key Responsibilities", details.get("key_responsibilities", [])
+        )
+
+    if "gap" in question_lower or "learn" in question_lower:
+        skill_gaps = state["analysis_results"].get("skill_gaps", {})
+        return format_skill_list(
+            "Critical Skills Needed", skill_gaps.get("critical_skills_needed", [])
+        )
+
+    return None
@@ -1,8 +1,401 @@
-from typing import Dict, List
+import copy
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
 
 from langchain.output_parsers import PydanticOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
+from langgraph.graph import END, StateGraph
+from pydantic import BaseModel, Field
 
 from src.models.schemas import JobPosting, WorkflowState
 from src.parsers.job_analyzer import JobAnalyzer
+from src.slack.formatters import format_job_analysis
+from src.storage.posting_index import PostingIndex
+from src.utils.resilience import LLMUnavailableError, ResilientLLM
+
+# Workflow nodes in execution order
+WORKFLOW_NODES = ["classification", "analysis", "skill_gaps", "final_response"]
+
+# Nodes re-run for a near-duplicate repost whose key fields changed; the
+# classification and skill gap analysis carry over from the original
+DETAIL_NODES = ["analysis", "final_response"]
+
+# Per-node LLM deadlines in seconds
+NODE_DEADLINES = {
+    "classification": 10.0,
+    "analysis": 30.0,
+    "skill_gaps": 30.0,
+    "final_response": 30.0,
+    "follow_up": 15.0,
+    # Batched: several resumes per request
+    "resume_extraction": 60.0,
+}
+
+# Shared across runs so breaker state and latency history persist
+_llm: Optional[ResilientLLM] = None
+_local_analyzer: Optional[JobAnalyzer] = None
+# Workflows run on worker threads; concurrent first calls must not each
+# build their own client (and circuit breaker) or load spaCy twice
+_llm_lock = threading.Lock()
+_local_analyzer_lock = threading.Lock()
+
+
+def get_llm() -> ResilientLLM:
+    """Get the shared resilient LLM client"""
+    global _llm
+    if _llm is None:
+        with _llm_lock:
+            if _llm is None:
+                hedge = os.environ.get("LLM_HEDGING", "").lower()
+                _llm = ResilientLLM(
+                    # Our layer owns retries and deadlines; the client just
+                    # times out
+                    ChatOpenAI(
+                        model="gpt-4-turbo-preview",
+                        temperature=0,
+                        timeout=max(NODE_DEADLINES.values()),
+                        max_retries=0,
+                    ),
+                    NODE_DEADLINES,
+                    hedge=hedge in ("1", "true", "yes"),
+                )
+    return _llm
+
+
+def _get_local_analyzer() -> JobAnalyzer:
+    """Get the shared rule-based analyzer used while the LLM is down"""
+    global _local_analyzer
+    if _local_analyzer is None:
+        with _local_analyzer_lock:
+            if _local_analyzer is None:
+                _local_analyzer = JobAnalyzer()
+    return _local_analyzer
+
+
+# Define structured output models
+class JobClassification(BaseModel):
+    """Output schema for job classification"""
+
+    is_job_posting: bool = Field(description="Whether the text is a job posting")
+    confidence: float = Field(description="Confidence score between 0 and 1")
+    posting_type: str = Field(
+        description="Type of posting: full-time, internship, contract, etc."
+    )
+
+
+class DetailedJobAnalysis(BaseModel):
+    """Output schema for detailed job analysis"""
+
+    job_title: str = Field(description="The title of the job position")
+    company_name: str = Field(description="Name of the company")
+    required_skills: List[str] = Field(description="Required technical and soft skills")
+    preferred_skills: List[str] = Field(description="Preferred but not required skills")
+    experience_level: str = Field(description="Required experience level")
+    salary_range: str = Field(description="Salary range if mentioned")
+    location: str = Field(description="Job location or remote status")
+    key_responsibilities: List[str] = Field(description="Main job responsibilities")
+    industry: str = Field(description="Industry sector")
+    application_deadline: str = Field(description="Application deadline if mentioned")
+
+
+class SkillGapAnalysis(BaseModel):
+    """Output schema for skill gap analysis"""
+
+    critical_skills_needed: List[str] = Field(
+        description="Most important skills needed"
+    )
+    skill_development_paths: List[Dict] = Field(
+        description="Suggested paths for skill development"
+    )
+    recommended_resources: List[Dict] = Field(
+        description="Learning resources for skill development"
+    )
+    estimated_learning_time: Dict = Field(
+        description="Estimated time to acquire each skill"
+    )
+
+
+def create_job_analysis_workflow(nodes: Optional[List[str]] = None) -> StateGraph:
+    """Create the job analysis workflow graph, optionally with a subset of nodes"""
+
+    # Initialize our LLM
+    llm = get_llm()
+
+    # Create our output parsers
+    classification_parser = PydanticOutputParser(pydantic_object=JobClassification)
+    analysis_parser = PydanticOutputParser(pydantic_object=DetailedJobAnalysis)
+    skill_gap_parser = PydanticOutputParser(pydantic_object=SkillGapAnalysis)
+
+    # Define workflow nodes
+    def classify_posting(state: WorkflowState) -> WorkflowState:
+        """Classify if the text is a job posting and its type"""
+        prompt = ChatPromptTemplate.from_messages(
+            [
+                (
+                    "system",
+                    "Analyze if the following text is a job posting. Consider structure, content, and language used.",
+                ),
+                ("user", "{text}"),
+                (
+                    "system",
+                    "Provide classification according to this schema: {format_instructions}",
+                ),
+            ]
+        )
+
+        messages = prompt.format_messages(
+            text=state["job_text"],
+            format_instructions=classification_parser.get_format_instructions(),
+        )
+
+        response = llm.invoke(messages, node="classification")
+        classification = classification_parser.parse(response.content)
+
+        state["analysis_results"]["classification"] = classification.model_dump()
+        state["current_step"] = "classification_complete"
+        return state
+
+    def analyze_job_details(state: WorkflowState) -> WorkflowState:
+        """Perform detailed analysis of the job posting"""
+        prompt = ChatPromptTemplate.from_messages(
+            [
+                (
+                    "system",
+                    """Analyze this job posting in detail. Extract all relevant information 
+            about requirements, responsibilities, and company details.""",
+                ),
+                ("user", "{text}"),
+                (
+                    "system",
+                    "Format your analysis according to this schema: {format_instructions}",
+                ),
+            ]
+        )
+
+        messages = prompt.format_messages(
+            text=state["job_text"],
+            format_instructions=analysis_parser.get_format_instructions(),
+        )
+
+        response = llm.invoke(messages, node="analysis")
+        analysis = analysis_parser.parse(response.content)
+
+        state["analysis_results"]["details"] = analysis.model_dump()
+        state["current_step"] = "analysis_complete"
+        return state
+
+    def analyze_skill_gaps(state: WorkflowState) -> WorkflowState:
+        """Analyze skill gaps and provide learning recommendations"""
+        job_details = state["analysis_results"]["details"]
+
+        prompt = ChatPromptTemplate.from_messages(
+            [
+                (
+                    "system",
+                    """Based on the job requirements, analyze the critical skills needed 
+            and provide detailed recommendations for skill development.""",
+                ),
+                ("user", "Job Details: {job_details}"),
+                (
+                    "system",
+                    "Provide analysis according to this schema: {format_instructions}",
+                ),
+            ]
+        )
+
+        messages = prompt.format_messages(
+            job_details=json.dumps(job_details),
+            format_instructions=skill_gap_parser.get_format_instructions(),
+        )
+
+        response = llm.invoke(messages, node="skill_gaps")
+        skill_analysis = skill_gap_parser.parse(response.content)
+
+        state["analysis_results"]["skill_gaps"] = skill_analysis.model_dump()
+        state["current_step"] = "skill_analysis_complete"
+        return state
+
+    def prepare_final_response(state: WorkflowState) -> WorkflowState:
+        """Prepare the final formatted response"""
+        prompt = ChatPromptTemplate.from_messages(
+            [
+                (
+                    "system",
+                    """Create a comprehensive, well-formatted response that combines all analysis results.
+            Format it for Slack with appropriate markdown and emojis.""",
+                ),
+                ("user", "Analysis Results: {results}"),
+            ]
+        )
+
+        messages = prompt.format_messages(results=json.dumps(state["analysis_results"]))
+
+        response = llm.invoke(messages, node="final_response")
+
+        state["recommendations"] = [response.content]
+        state["current_step"] = "complete"
+        return state
+
+    # Define conditional routing
+    def should_continue_analysis(state: WorkflowState) -> Tuple[bool, str]:
+        """Determine if we should continue with detailed analysis"""
+        classification = state["analysis_results"].get("classification", {})
+        is_job = classification.get("is_job_posting", False)
+        confidence = classification.get("confidence", 0)
+
+        if is_job and confidence > 0.8:
+            return True, "continue"
+        return False, "end"
+
+    # Create the workflow graph
+    workflow = StateGraph(WorkflowState)
+
+    node_functions = {
+        "classification": classify_posting,
+        "analysis": analyze_job_details,
+        "skill_gaps": analyze_skill_gaps,
+        "final_response": prepare_final_response,
+    }
+    nodes = [node for node in WORKFLOW_NODES if node in (nodes or WORKFLOW_NODES)]
+
+    # Add nodes
+    for node in nodes:
+        workflow.add_node(node, node_functions[node])
+
+    # Chain them in order
+    for current, following in zip(nodes, nodes[1:] + [END]):
+        workflow.add_edge(current, following)
+
+    # Set entry point
+    workflow.set_entry_point(nodes[0])
+
+    return workflow
+
+
+def answer_follow_up_question(state: WorkflowState, question: str) -> str:
+    """Answer a thread reply from a checkpointed analysis with a single LLM call"""
+    llm = get_llm()
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            (
+                "system",
+                """Answer the question about this job posting using only the analysis
+            results below. Keep it short and format it for Slack.""",
+            ),
+            ("user", "Analysis Results: {results}"),
+            ("user", "{question}"),
+        ]
+    )
+
+    messages = prompt.format_messages(
+        results=json.dumps(state["analysis_results"]), question=question
+    )
+    return llm.invoke(messages, node="follow_up").content
+
+
+# Function to run the workflow
+def analyze_job_posting(
+    text: str, posting_index: Optional[PostingIndex] = None
+) -> Dict:
+    """Run the job posting through the analysis workflow.
+
+    With a posting index, near-duplicate reposts reuse the stored analysis and
+    only re-run detail extraction when their key fields differ.
+    """
+
+    # Create initial state
+    initial_state: WorkflowState = {
+        "messages": [],
+        "job_text": text,
+        "current_step": "start",
+        "analysis_results": {},
+        "matching_results": {},
+        "recommendations": [],
+        "errors": [],
+    }
+    nodes = WORKFLOW_NODES
+
+    match = posting_index.lookup(text) if posting_index else None
+    if match and match.key_fields_match:
+        return {
+            "success": True,
+            "results": match.results,
+            "recommendations": match.recommendations,
+            "cached": True,
+            "state": {
+                **initial_state,
+                "current_step": "complete",
+                "analysis_results": match.results,
+                "recommendations": match.recommendations,
+            },
+        }
+    if match:
+        initial_state["analysis_results"] = copy.deepcopy(match.results)
+        nodes = DETAIL_NODES
+
+    # Run the workflow
+    try:
+        workflow = create_job_analysis_workflow(nodes).compile()
+        final_state = workflow.invoke(initial_state)
+        classification = final_state["analysis_results"].get("classification", {})
+        if posting_index and classification.get("is_job_posting"):
+            posting_index.add(
+                text, final_state["analysis_results"], final_state["recommendations"]
+            )
+        return {
+            "success": True,
+            "results": final_state["analysis_results"],
+            "recommendations": final_state["recommendations"],
+            "cached": False,
+            "state": final_state,
+        }
+    except LLMUnavailableError as e:
+        print(f"LLM unavailable, falling back to local analysis: {str(e)}")
+        return _analyze_locally(initial_state, str(e))
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+def _analyze_locally(state: WorkflowState, error: str) -> Dict:
+    """Degraded analysis with the rule-based JobAnalyzer when the LLM is down"""
+    local_analyzer = _get_local_analyzer()
+
+    text = state["job_text"]
+    is_job = local_analyzer.is_job_posting(text)
+    results = {
+        "classification": {
+            "is_job_posting": is_job,
+            "confidence": 1.0 if is_job else 0.0,
+            "posting_type": "unknown",
+        }
+    }
+    recommendations = []
+    if is_job:
+        analysis = local_analyzer.analyze_job_posting(text)
+        results["details"] = {
+            "company_name": "Not specified",
+            "preferred_skills": [],
+            "location": "Not specified",
+            "key_responsibilities": [],
+            **analysis,
+        }
+        recommendations = [format_job_analysis(analysis)]
+
+    state = {
+        **state,
+        "current_step": "complete",
+        "analysis_results": results,
+        "recommendations": recommendations,
+        "errors": state["errors"] + [error],
+    }
+    return {
+        "success": True,
+        "results": results,
+        "recommendations": recommendations,
+        "cached": False,
+        "degraded": True,
+        "state": state,
+    }